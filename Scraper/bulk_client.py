@@ -0,0 +1,197 @@
+# APP/Scraper/bulk_client.py
+"""HTTP client for ``POST /jobs/bulk``.
+
+One keep-alive session, gzip request bodies, a few chunks in flight, and
+chunk sizes that follow the measured server latency. Failed chunks are
+retried with backoff: the endpoint de-duplicates on source_url and content
+hash, so replaying a chunk that was already applied only turns its rows
+into ``skipped``/``unchanged``.
+"""
+from __future__ import annotations
+
+import gzip, json, os, random, threading, time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Dict, List
+
+import requests
+from requests.adapters import HTTPAdapter
+
+BULK_IN_FLIGHT = int(os.getenv("SCRAPER_BULK_IN_FLIGHT", "3"))
+BULK_RETRIES = int(os.getenv("SCRAPER_BULK_RETRIES", "4"))
+BULK_GZIP = os.getenv("SCRAPER_BULK_GZIP", "true").lower() == "true"
+BULK_TARGET_LATENCY_S = float(os.getenv("SCRAPER_BULK_TARGET_LATENCY_S", "2.0"))
+
+RETRY_STATUSES = {408, 425, 429, 500, 502, 503, 504}
+SUMMARY_KEYS = ("inserted", "updated", "unchanged", "skipped", "invalid", "failed")
+
+
+class BulkClient:
+    def __init__(self, api_base: str, max_in_flight: int = BULK_IN_FLIGHT, retries: int = BULK_RETRIES,
+                 compress: bool = BULK_GZIP, target_latency_s: float = BULK_TARGET_LATENCY_S,
+                 start_chunk: int = 50, min_chunk: int = 10, max_chunk: int = 500,
+                 backoff_s: float = 0.5, timeout: float = 90, compress_min_bytes: int = 1024):
+        self.url = api_base.rstrip("/") + "/jobs/bulk"
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.retries = max(0, int(retries))
+        self.compress = compress
+        self.compress_min_bytes = compress_min_bytes
+        self.target_latency_s = target_latency_s
+        self.min_chunk = max(1, int(min_chunk))
+        self.max_chunk = max(self.min_chunk, int(max_chunk))
+        self.chunk = min(max(int(start_chunk), self.min_chunk), self.max_chunk)
+        self.backoff_s = backoff_s
+        self.timeout = timeout
+        self._per_item_s: float | None = None
+        self._lock = threading.Lock()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_in_flight)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---- chunk sizing ----
+    def _observe(self, size: int, latency_s: float) -> None:
+        """Fold a chunk's latency into the per-item estimate and resize."""
+        with self._lock:
+            per_item = latency_s / max(1, size)
+            self._per_item_s = per_item if self._per_item_s is None else 0.7 * self._per_item_s + 0.3 * per_item
+            want = int(self.target_latency_s / max(self._per_item_s, 1e-6))
+            # Grow at most 2x per step so one fast chunk cannot overshoot
+            self.chunk = max(self.min_chunk, min(self.max_chunk, want, self.chunk * 2))
+
+    def _shrink(self) -> None:
+        with self._lock:
+            self.chunk = max(self.min_chunk, self.chunk // 2)
+            self.max_chunk = max(self.min_chunk, self.chunk)
+
+    # ---- one request ----
+    def _body(self, chunk: List[Dict[str, Any]], mode: str, listed_urls: List[str] | None = None):
+        payload: Dict[str, Any] = {"items": chunk, "mode": mode}
+        if listed_urls:
+            payload["listed_urls"] = listed_urls
+        raw = json.dumps(payload, default=str).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        if self.compress and len(raw) >= self.compress_min_bytes:
+            headers["Content-Encoding"] = "gzip"
+            return gzip.compress(raw, compresslevel=5), headers, len(raw)
+        return raw, headers, len(raw)
+
+    def _retry_delay(self, attempt: int, resp: requests.Response | None) -> float:
+        after = resp.headers.get("Retry-After") if resp is not None else None
+        if after and after.isdigit():
+            return float(after)
+        return self.backoff_s * (2 ** attempt) + random.uniform(0, self.backoff_s)
+
+    def _send(self, start: int, chunk: List[Dict[str, Any]], mode: str,
+              listed_urls: List[str] | None = None) -> Dict[str, Any]:
+        body, headers, raw_bytes = self._body(chunk, mode, listed_urls)
+        report: Dict[str, Any] = {
+            "range": [start, start + len(chunk) - 1], "size": len(chunk),
+            "bytes": raw_bytes, "wire_bytes": len(body), "attempts": 0,
+        }
+        for attempt in range(self.retries + 1):
+            report["attempts"] = attempt + 1
+            resp = None
+            t0 = time.perf_counter()
+            try:
+                resp = self.session.post(self.url, data=body, headers=headers, timeout=self.timeout)
+                report["latency_s"] = round(time.perf_counter() - t0, 4)
+                report["status"] = resp.status_code
+                if resp.status_code < 400:
+                    self._observe(len(chunk), report["latency_s"])
+                    report["data"] = resp.json()
+                    return report
+                if resp.status_code == 413 and len(chunk) > 1:
+                    self._shrink()
+                    report["split"] = True
+                    return report
+                report["error"] = resp.text[:500]
+                if resp.status_code not in RETRY_STATUSES:
+                    return report
+            except (requests.ConnectionError, requests.Timeout) as e:
+                report["latency_s"] = round(time.perf_counter() - t0, 4)
+                report["status"] = None
+                report["error"] = str(e)
+            except ValueError as e:  # 2xx with a body that is not JSON
+                report["error"] = f"Bad response body: {e}"
+                return report
+            if attempt < self.retries:
+                time.sleep(self._retry_delay(attempt, resp))
+        return report
+
+    # ---- whole batch ----
+    def post(self, items: List[Dict[str, Any]], mode: str = "insert",
+             listed_urls: List[str] | None = None) -> Dict[str, Any]:
+        """Send ``items`` in adaptive chunks; returns the merged bulk summary.
+
+        ``listed_urls`` ride along with the first chunk (marking them seen is idempotent).
+        """
+        totals = {k: 0 for k in SUMMARY_KEYS}
+        reports: List[Dict[str, Any]] = []
+        queue: List[tuple[int, int]] = []  # (start, end) of chunks handed back by a 413 split
+        nxt = 0
+        t0 = time.perf_counter()
+
+        def take():
+            nonlocal nxt
+            if queue:
+                return queue.pop(0)
+            if nxt >= len(items):
+                return None
+            start, nxt = nxt, min(len(items), nxt + self.chunk)
+            return start, nxt
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as pool:
+            running = set()
+            while True:
+                while len(running) < self.max_in_flight:
+                    span = take()
+                    if span is None:
+                        break
+                    listed = listed_urls if span[0] == 0 else None
+                    running.add(pool.submit(self._send, span[0], items[span[0]:span[1]], mode, listed))
+                if not running:
+                    break
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    rep = fut.result()
+                    if rep.pop("split", False):
+                        a, b = rep["range"][0], rep["range"][1] + 1
+                        mid = (a + b) // 2
+                        queue[:0] = [(a, mid), (mid, b)]
+                        continue
+                    reports.append(rep)
+
+        reports.sort(key=lambda r: r["range"][0])
+        details: List[Any] = []
+        for rep in reports:
+            data = rep.pop("data", None)
+            if data is None:
+                details.append({k: rep.get(k) for k in ("range", "status", "error", "attempts")})
+                continue
+            summary = data.get("summary", {}) or {}
+            for k in SUMMARY_KEYS:
+                totals[k] += int(summary.get(k, 0))
+            details.extend(data.get("results", []))
+
+        latencies = sorted(r["latency_s"] for r in reports if r.get("latency_s") is not None)
+        return {
+            "summary": totals,
+            "results": details,
+            "chunks": reports,
+            "timing": {
+                "elapsed_s": round(time.perf_counter() - t0, 4),
+                "chunks": len(reports),
+                "retried": sum(1 for r in reports if r["attempts"] > 1),
+                "latency_p50_s": latencies[len(latencies) // 2] if latencies else None,
+                "latency_max_s": latencies[-1] if latencies else None,
+            },
+        }
@@ -0,0 +1,145 @@
+# APP/Scraper/checkpoint.py
+"""Resumable state for one-off scrape runs (scrape.run / POST /api/scrape/start).
+
+A run records its parameters, the discovered link list, and each detail URL
+as it finishes, together with the scraped item. Resuming a run skips
+discovery and every finished URL, and re-saves the stored items, which
+the bulk endpoint de-duplicates.
+"""
+from __future__ import annotations
+
+import json, os, sqlite3, time
+from contextlib import contextmanager
+from typing import Any, Dict, List
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    base_url TEXT NOT NULL,
+    lim INTEGER NOT NULL,
+    mode TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'running',
+    error TEXT,
+    summary TEXT,
+    started_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS run_links (
+    run_id INTEGER NOT NULL,
+    pos INTEGER NOT NULL,
+    url TEXT NOT NULL,
+    PRIMARY KEY (run_id, pos)
+);
+CREATE TABLE IF NOT EXISTS run_urls (
+    run_id INTEGER NOT NULL,
+    url TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    item TEXT,
+    finished_at REAL,
+    PRIMARY KEY (run_id, url)
+);
+"""
+
+
+class RunCheckpoint:
+    def __init__(self, path: str, max_attempts: int = 2):
+        self.path = path
+        self.max_attempts = max(1, int(max_attempts))
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._conn() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _conn(self):
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            yield conn
+        finally:
+            conn.close()
+
+    # ---- runs ----
+    def begin(self, base_url: str, limit: int, mode: str) -> int:
+        now = time.time()
+        with self._conn() as conn:
+            return conn.execute(
+                "INSERT INTO runs (base_url, lim, mode, started_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (base_url, int(limit), mode, now, now),
+            ).lastrowid
+
+    def get(self, run_id: int) -> Dict[str, Any] | None:
+        with self._conn() as conn:
+            row = conn.execute(
+                "SELECT id, base_url, lim, mode, status, error, summary, started_at, updated_at FROM runs WHERE id = ?",
+                (run_id,),
+            ).fetchone()
+            if not row:
+                return None
+            counts = dict(conn.execute(
+                "SELECT status, COUNT(*) FROM run_urls WHERE run_id = ? GROUP BY status", (run_id,)
+            ).fetchall())
+            links = conn.execute("SELECT COUNT(*) FROM run_links WHERE run_id = ?", (run_id,)).fetchone()[0]
+        return {
+            "id": row[0], "base_url": row[1], "limit": row[2], "mode": row[3], "status": row[4],
+            "error": row[5], "summary": json.loads(row[6]) if row[6] else None,
+            "started_at": row[7], "updated_at": row[8],
+            "links": links, "done": counts.get("done", 0), "failed": counts.get("failed", 0),
+        }
+
+    def set_status(self, run_id: int, status: str, error: str | None = None,
+                   summary: Dict[str, Any] | None = None) -> None:
+        with self._conn() as conn:
+            conn.execute(
+                "UPDATE runs SET status = ?, error = ?, summary = COALESCE(?, summary), updated_at = ? WHERE id = ?",
+                (status, error, json.dumps(summary) if summary is not None else None, time.time(), run_id),
+            )
+
+    # ---- links ----
+    def save_links(self, run_id: int, links: List[str]) -> None:
+        with self._conn() as conn:
+            conn.execute("BEGIN")
+            conn.execute("DELETE FROM run_links WHERE run_id = ?", (run_id,))
+            conn.executemany(
+                "INSERT INTO run_links (run_id, pos, url) VALUES (?, ?, ?)",
+                [(run_id, i, u) for i, u in enumerate(links)],
+            )
+            conn.execute("COMMIT")
+
+    def links(self, run_id: int) -> List[str]:
+        with self._conn() as conn:
+            return [r[0] for r in conn.execute(
+                "SELECT url FROM run_links WHERE run_id = ? ORDER BY pos", (run_id,)
+            )]
+
+    # ---- detail pages ----
+    def finish(self, run_id: int, url: str, item: Dict[str, Any]) -> None:
+        with self._conn() as conn:
+            conn.execute(
+                "INSERT INTO run_urls (run_id, url, status, attempts, item, finished_at) VALUES (?, ?, 'done', 1, ?, ?) "
+                "ON CONFLICT(run_id, url) DO UPDATE SET status = 'done', attempts = attempts + 1, "
+                "item = excluded.item, finished_at = excluded.finished_at",
+                (run_id, url, json.dumps(item, default=str), time.time()),
+            )
+
+    def fail(self, run_id: int, url: str) -> None:
+        with self._conn() as conn:
+            conn.execute(
+                "INSERT INTO run_urls (run_id, url, status, attempts) VALUES (?, ?, 'failed', 1) "
+                "ON CONFLICT(run_id, url) DO UPDATE SET attempts = attempts + 1",
+                (run_id, url),
+            )
+
+    def skip_urls(self, run_id: int) -> set[str]:
+        """URLs a resumed run should not load again: done, or out of attempts."""
+        with self._conn() as conn:
+            return {r[0] for r in conn.execute(
+                "SELECT url FROM run_urls WHERE run_id = ? AND (status = 'done' OR attempts >= ?)",
+                (run_id, self.max_attempts),
+            )}
+
+    def items(self, run_id: int) -> List[Dict[str, Any]]:
+        with self._conn() as conn:
+            return [json.loads(r[0]) for r in conn.execute(
+                "SELECT item FROM run_urls WHERE run_id = ? AND status = 'done' ORDER BY finished_at", (run_id,)
+            )]
@@ -0,0 +1,198 @@
+# APP/Scraper/crawler.py
+"""Scheduled multi-listing crawl over a shared URL frontier.
+
+Each cycle discovers the listing pages that are due (experience levels,
+sectors, countries, ...), feeds every detail link into one deduplicated
+frontier, then drains it with a few workers that each hold a pooled
+driver. State lives in a local Frontier file, so a restart resumes the
+open cycle instead of starting over.
+"""
+from __future__ import annotations
+
+import os, threading
+from typing import Any, Callable, Dict, List
+
+from frontier import Frontier, host_id
+from scrape import DriverPool, discover_links, scrape_detail, driver_is_healthy, polite_pause, DESCRIPTION_MAX_CHARS
+
+
+def parse_listings(spec: str, default_interval_min: float, default_limit: int) -> List[Dict[str, Any]]:
+    """Parse ``url|minutes|limit`` entries (comma-separated; trailing parts optional)."""
+    listings = []
+    for entry in (spec or "").split(","):
+        parts = [p.strip() for p in entry.split("|")]
+        if not parts or not parts[0]:
+            continue
+        listings.append({
+            "url": parts[0],
+            "interval_s": float(parts[1] or default_interval_min) * 60 if len(parts) > 1 else default_interval_min * 60,
+            "limit": int(parts[2] or default_limit) if len(parts) > 2 else default_limit,
+        })
+    return listings
+
+
+class CrawlScheduler:
+    """Runs crawl cycles on a timer; ``save(items)`` persists each batch."""
+
+    def __init__(self, listings: List[Dict[str, Any]], frontier: Frontier,
+                 save: Callable[[List[Dict[str, Any]]], Any], workers: int = 2,
+                 claim_size: int = 5, save_batch: int = 25, tick_s: float = 60.0,
+                 headless: bool = True, max_pages_per_driver: int = 200,
+                 description_max_chars: int = DESCRIPTION_MAX_CHARS):
+        self.listings = listings
+        self.frontier = frontier
+        self.save = save
+        self.workers = max(1, int(workers))
+        self.claim_size = max(1, int(claim_size))
+        self.save_batch = max(1, int(save_batch))
+        self.tick_s = tick_s
+        self.description_max_chars = description_max_chars
+        self.pool = DriverPool(size=self.workers, max_pages=max_pages_per_driver, headless=headless)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._worker_prefix = f"{host_id()}:{os.getpid()}:"
+
+    # ---- lifecycle ----
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.loop, name="crawl-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+        self.pool.close()
+
+    def loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_cycle()
+            except Exception as e:
+                print(f"Crawl cycle failed: {e}")
+            self._stop.wait(self.tick_s)
+
+    # ---- one cycle ----
+    def _due(self) -> List[Dict[str, Any]]:
+        return [l for l in self.listings if self.frontier.listing_due(l["url"], l["interval_s"])]
+
+    def run_cycle(self) -> Dict[str, Any] | None:
+        """Resume the open cycle, or start one if any listing is due."""
+        cycle = self.frontier.current_cycle()
+        if cycle is None:
+            due = self._due()
+            if not due:
+                return None
+            cycle = self.frontier.begin_cycle()
+        else:
+            # Claims held by an earlier process on this host died with it
+            self.frontier.release_claims(cycle, worker_prefix=f"{host_id()}:")
+            due = [l for l in self._due() if not self.frontier.listing_done_in(l["url"], cycle)]
+
+        self._discover(cycle, due)
+        self._drain(cycle)
+        counts = self.frontier.counts(cycle)
+        if not counts["pending"] and not counts["claimed"]:
+            self.frontier.finish_cycle(cycle)
+        return {"cycle": cycle, "frontier": counts}
+
+    def _discover(self, cycle: int, listings: List[Dict[str, Any]]) -> None:
+        if not listings:
+            return
+        driver = self.pool.acquire()
+        pages = 0
+        try:
+            for listing in listings:
+                if self._stop.is_set():
+                    return
+                try:
+                    links = discover_links(driver, listing["url"], want=listing["limit"])[:listing["limit"]]
+                except Exception as e:
+                    print(f"Listing discovery failed for {listing['url']}: {e}")
+                    links = []
+                pages += 1
+                added = self.frontier.add(cycle, links, source=listing["url"])
+                self.frontier.mark_listing(listing["url"], cycle)
+                print(f"[cycle {cycle}] {listing['url']}: {len(links)} links, {added} new to frontier")
+        finally:
+            self.pool.release(driver, pages=pages)
+
+    def _drain(self, cycle: int) -> None:
+        threads = [
+            threading.Thread(target=self._worker, args=(cycle, f"{self._worker_prefix}{i}"), daemon=True)
+            for i in range(self.workers)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    def _worker(self, cycle: int, worker: str) -> None:
+        driver = self.pool.acquire()
+        pages = 0
+        items: List[Dict[str, Any]] = []
+        scraped: List[str] = []
+        held: List[str] = []  # claimed by this worker and not yet completed or failed
+        try:
+            while not self._stop.is_set():
+                urls = self.frontier.claim(cycle, worker, self.claim_size)
+                if not urls:
+                    break
+                held.extend(urls)
+                failed = []
+                for url in urls:
+                    try:
+                        item = scrape_detail(driver, url, description_max_chars=self.description_max_chars)
+                    except Exception as e:
+                        print(f"[{worker}] {url}: {e}")
+                        item = None
+                    # A crashed Chrome mostly surfaces as a None item (scrape_detail
+                    # swallows navigation errors): recycle it and carry on
+                    if not item and not driver_is_healthy(driver):
+                        self.pool.release(driver, pages=self.pool.max_pages)
+                        driver, pages = None, 0  # released: finally must not release it again
+                        driver = self.pool.acquire()
+                    pages += 1
+                    if item:
+                        items.append(item)
+                        scraped.append(url)
+                    else:
+                        failed.append(url)
+                    polite_pause()
+                if failed:
+                    self.frontier.fail(cycle, failed)
+                    gone = set(failed)
+                    held = [u for u in held if u not in gone]
+                if len(items) >= self.save_batch:
+                    held = self._flush(cycle, items, scraped, held)
+            self._flush(cycle, items, scraped, held)
+        except Exception as e:
+            # e.g. no replacement browser: hand the claims back instead of
+            # leaving them claimed until the next tick
+            print(f"[{worker}] stopped: {e}")
+            if held:
+                self.frontier.fail(cycle, held)
+        finally:
+            if driver is not None:
+                self.pool.release(driver, pages=pages)
+
+    def _flush(self, cycle: int, items: List[Dict[str, Any]], scraped: List[str],
+               held: List[str]) -> List[str]:
+        """Save ``items``; returns ``held`` minus the URLs settled here."""
+        # URLs are only marked done once their items are saved
+        if not items:
+            return held
+        try:
+            self.save(list(items))
+        except Exception as e:
+            print(f"[cycle {cycle}] saving {len(items)} jobs failed: {e}")
+            # Back to pending (failed after max_attempts) rather than stuck as claimed
+            self.frontier.fail(cycle, scraped)
+        else:
+            self.frontier.complete(cycle, scraped)
+        settled = set(scraped)
+        items.clear()
+        scraped.clear()
+        return [u for u in held if u not in settled]
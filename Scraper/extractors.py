@@ -0,0 +1,165 @@
+# APP/Scraper/extractors.py
+"""Per-domain detail-page extractors.
+
+An extractor declares its single-value fields once as ordered CSS selector
+lists: the first selector whose first match has text wins. The lists are
+compiled into a SelectorPlan that reads every field in one pass over the
+page. After a few pages the plan keeps only the selectors that actually
+supplied a value ("hot") and tries the rest only for fields the hot pass
+missed, so a miss still gets the full declared chain.
+
+Once learned, a page where a cold selector *and* a lower-priority hot one
+both match takes the hot one's text, where the full chain would take the
+cold one's. Pass ``learn_pages=0`` for strict declared-priority lookups.
+
+Register extractors with ``register()``; ``extractor_for(url)`` picks one by
+host (suffix match), falling back to the default.
+"""
+from __future__ import annotations
+
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List
+from urllib.parse import urlsplit
+
+import soupsieve as sv
+from bs4 import BeautifulSoup
+
+LEARN_PAGES = 5
+
+
+class SelectorPlan:
+    def __init__(self, fields: Dict[str, List[str]], learn_pages: int = LEARN_PAGES):
+        self.fields = {name: list(sels) for name, sels in fields.items()}
+        self.learn_pages = max(0, int(learn_pages))
+        self._compiled = {sel: sv.compile(sel) for sels in self.fields.values() for sel in sels}
+        self._hits: Dict[str, Dict[str, int]] = {name: {} for name in self.fields}
+        self._pages = 0
+        self._lock = threading.Lock()
+        self._unions: Dict[tuple, Any] = {}
+        # Until learn_pages have been seen every selector is "hot"
+        self._hot = self.fields
+        self._cold: Dict[str, List[str]] = {name: [] for name in self.fields}
+
+    def _learn(self) -> None:
+        # Hot selectors keep their declared priority; the rest become fallbacks
+        self._hot = {n: [s for s in sels if self._hits[n].get(s)] for n, sels in self.fields.items()}
+        self._cold = {n: [s for s in sels if not self._hits[n].get(s)] for n, sels in self.fields.items()}
+
+    def _union_for(self, sels: List[str]):
+        key = tuple(sorted(set(sels)))
+        if key not in self._unions:
+            self._unions[key] = sv.compile(", ".join(key)) if key else None
+        return self._unions[key]
+
+    def _resolve(self, soup, plan: Dict[str, List[str]], out: Dict[str, str | None], used: Dict[str, str]) -> None:
+        """One tree walk for all of ``plan``; each field takes its first selector with text.
+
+        The walk stops as soon as every field is settled, so hits near the
+        top of the page cost no more than a ``select_one``.
+        """
+        plan = {name: sels for name, sels in plan.items() if sels}
+        union = self._union_for([sel for sels in plan.values() for sel in sels])
+        if union is None:
+            return
+        first: Dict[str, Dict[int, Any]] = {name: {} for name in plan}  # selector index -> first match
+        texts: Dict[int, str] = {}
+
+        def text_of(el) -> str:
+            if id(el) not in texts:
+                texts[id(el)] = el.get_text(strip=True)
+            return texts[id(el)]
+
+        def settled(name: str) -> bool:
+            # Every higher-priority selector has matched (empty) before one with text
+            for i in range(len(plan[name])):
+                if i not in first[name]:
+                    return False
+                if text_of(first[name][i]):
+                    return True
+            return True
+
+        pending = set(plan)
+        for el in union.iselect(soup):
+            for name in list(pending):
+                for i, sel in enumerate(plan[name]):
+                    if i not in first[name] and self._compiled[sel].match(el):
+                        first[name][i] = el
+                if settled(name):
+                    pending.discard(name)
+            if not pending:
+                break
+        for name, sels in plan.items():
+            for i, sel in enumerate(sels):
+                el = first[name].get(i)
+                if el is not None and text_of(el):
+                    out[name], used[name] = text_of(el), sel
+                    break
+
+    def extract(self, soup: BeautifulSoup) -> Dict[str, str | None]:
+        with self._lock:
+            hot, cold = self._hot, self._cold
+        out: Dict[str, str | None] = dict.fromkeys(self.fields)
+        used: Dict[str, str] = {}
+        self._resolve(soup, hot, out, used)
+        missed = {name: cold[name] for name in self.fields if out[name] is None and cold[name]}
+        if missed:
+            self._resolve(soup, missed, out, used)
+
+        with self._lock:
+            self._pages += 1
+            promoted = False
+            for name, sel in used.items():
+                self._hits[name][sel] = self._hits[name].get(sel, 0) + 1
+                promoted = promoted or sel in self._cold[name]
+            if self._pages == self.learn_pages or (promoted and self._pages > self.learn_pages):
+                self._learn()
+        return out
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "pages": self._pages,
+                "hot": {n: list(s) for n, s in self._hot.items()},
+                "hits": {n: dict(h) for n, h in self._hits.items()},
+            }
+
+
+class Extractor(ABC):
+    """Base class: set ``domains`` and ``fields``; implement ``extract``."""
+
+    name = "base"
+    domains: tuple[str, ...] = ()
+    fields: Dict[str, List[str]] = {}
+
+    def __init__(self, learn_pages: int = LEARN_PAGES):
+        self.plan = SelectorPlan(self.fields, learn_pages=learn_pages)
+
+    @abstractmethod
+    def extract(self, soup: BeautifulSoup, url: str, **options) -> Dict[str, Any] | None:
+        """Return the job item for a parsed detail page, or None if it is not one."""
+
+
+_registry: Dict[str, Extractor] = {}
+_default: Extractor | None = None
+
+
+def register(extractor: Extractor, default: bool = False) -> Extractor:
+    global _default
+    for domain in extractor.domains:
+        _registry[domain.lower().lstrip(".")] = extractor
+    if default or _default is None:
+        _default = extractor
+    return extractor
+
+
+def extractor_for(url: str) -> Extractor:
+    host = (urlsplit(url).hostname or "").lower()
+    while host:
+        if host in _registry:
+            return _registry[host]
+        host = host.partition(".")[2]
+    if _default is None:
+        raise LookupError("No extractors registered")
+    return _default
+
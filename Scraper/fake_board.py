@@ -0,0 +1,253 @@
+# APP/Scraper/fake_board.py
+"""Local stand-in for actuarylist.com, for load tests (see loadtest.py).
+
+Serves synthetic pages shaped like the real site:
+
+    /<any listing path>           first page of detail links + infinite scroll
+    /_more?offset=N               next batch of links (fetched by the scroll script)
+    /actuarial-jobs/<id>-<slug>   detail page (h1, company, location links,
+                                  "N days ago", salary, job type, tags, JSON-LD)
+
+Content is deterministic per job id. Latency and failures are injectable:
+
+    python fake_board.py --port 8765 --jobs 500 --latency-ms 80 --jitter-ms 40 \\
+        --error-rate 0.02 --slow-rate 0.01 --slow-ms 5000
+"""
+from __future__ import annotations
+
+import argparse, html, json, random, threading, time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict
+from urllib.parse import parse_qs, urlsplit
+
+_COMPANIES = ["Acme Re", "Swiss Mutual", "Northwind Life", "Contoso Pensions", "Globex Insurance", "Initech Health"]
+_CITIES = [("London", "United Kingdom"), ("New York", "United States"), ("Zurich", "Switzerland"),
+           ("Toronto", "Canada"), ("Singapore", "Singapore"), ("Chicago", "United States")]
+_TITLES = ["Pricing Actuary", "Senior Actuary", "Actuarial Analyst", "Reserving Actuary",
+           "Capital Modelling Actuary", "Head of Actuarial"]
+_TAGS = ["Pricing", "Reserving", "Life", "P&C", "Health", "Pensions", "IFRS 17", "Solvency II", "Python", "R"]
+_SALARIES = ["$100K - $150K", "£55,000 - £70,000", "€80k-€95k", "$60 - $75 an hour", None]
+_TYPES = ["Full-time", "Contract", "Part-time"]
+_WORDS = ("actuarial pricing reserving model capital risk insurance portfolio analysis team "
+          "stakeholders regulatory reporting data experience assumptions valuation").split()
+
+
+def _slug(text: str) -> str:
+    return "-".join("".join(c if c.isalnum() else " " for c in text.lower()).split())
+
+
+def job(job_id: int) -> Dict[str, Any]:
+    """Synthetic posting; the same id always yields the same content."""
+    rnd = random.Random(job_id)
+    city, country = rnd.choice(_CITIES)
+    company = rnd.choice(_COMPANIES)
+    paragraphs = [" ".join(rnd.choice(_WORDS) for _ in range(rnd.randint(40, 90))).capitalize() + "."
+                  for _ in range(rnd.randint(3, 8))]
+    return {
+        "id": job_id,
+        "title": f"{rnd.choice(_TITLES)} {job_id}",
+        "company": company,
+        "city": city,
+        "country": country,
+        "days_ago": rnd.randint(0, 30),
+        "salary": rnd.choice(_SALARIES),
+        "job_type": rnd.choice(_TYPES),
+        "tags": rnd.sample(_TAGS, rnd.randint(2, 5)),
+        "paragraphs": paragraphs,
+        "path": f"/actuarial-jobs/{job_id}-{_slug(company)}",
+    }
+
+
+_LISTING = """<!doctype html>
+<html><head><title>Actuarial jobs</title></head>
+<body>
+<nav><a href="/">Home</a> <button>Accept cookies</button></nav>
+<main id="jobs">{cards}</main>
+<footer style="height:400px">Fake board</footer>
+<script>
+let offset = {next_offset}, loading = false;
+window.addEventListener("scroll", async () => {{
+  if (loading || offset < 0) return;
+  if (window.innerHeight + window.scrollY < document.body.scrollHeight - 200) return;
+  loading = true;
+  const r = await fetch("/_more?offset=" + offset);
+  if (r.ok) {{
+    const data = await r.json();
+    document.getElementById("jobs").insertAdjacentHTML("beforeend", data.html);
+    offset = data.next_offset;
+  }}
+  loading = false;
+}});
+</script>
+</body></html>"""
+
+_DETAIL = """<!doctype html>
+<html><head><title>{title}</title>
+<script type="application/ld+json">{ld}</script></head>
+<body>
+<header><h1 class="job-title">{title}</h1></header>
+<div class="company-name"><a href="/companies/{company_slug}">{company}</a></div>
+<div class="job-location"><a href="/cities/{city_slug}">{city}</a> <a href="/countries/{country_slug}">{country}</a></div>
+<span class="posted-at">{posted}</span>
+{salary}
+<span class="job-type">{job_type}</span>
+<div class="keywords">{tags}</div>
+<article class="job-content">{body}</article>
+<a class="btn apply" href="#">Apply</a>
+</body></html>"""
+
+
+def _card(j: Dict[str, Any]) -> str:
+    return (f'<div class="job-card"><a href="{j["path"]}">{html.escape(j["title"])}</a>'
+            f'<span class="company">{html.escape(j["company"])}</span></div>')
+
+
+def _detail_html(j: Dict[str, Any]) -> str:
+    ld = {
+        "@context": "https://schema.org", "@type": "JobPosting", "title": j["title"],
+        "description": "".join(f"<p>{p}</p>" for p in j["paragraphs"]),
+        "hiringOrganization": {"@type": "Organization", "name": j["company"]},
+        "jobLocation": {"@type": "Place", "address": {"addressLocality": j["city"], "addressCountry": j["country"]}},
+    }
+    posted = "Just posted" if j["days_ago"] == 0 else f'{j["days_ago"]} days ago'
+    return _DETAIL.format(
+        title=html.escape(j["title"]),
+        ld=json.dumps(ld).replace("</", "<\\/"),
+        company=html.escape(j["company"]), company_slug=_slug(j["company"]),
+        city=j["city"], city_slug=_slug(j["city"]),
+        country=j["country"], country_slug=_slug(j["country"]),
+        posted=posted,
+        salary=f'<div class="salary">{html.escape(j["salary"])}</div>' if j["salary"] else "",
+        job_type=j["job_type"],
+        tags="".join(f'<a href="/keywords/{_slug(t)}">{html.escape(t)}</a>' for t in j["tags"]),
+        body="".join(f"<p>{p}</p>" for p in j["paragraphs"]),
+    )
+
+
+class FakeBoard:
+    """Threaded HTTP server; ``start()`` runs it in the background."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, jobs: int = 500, page_size: int = 20,
+                 latency_ms: float = 0, jitter_ms: float = 0, error_rate: float = 0.0,
+                 slow_rate: float = 0.0, slow_ms: float = 5000, seed: int = 0):
+        self.jobs = max(1, int(jobs))
+        self.page_size = max(1, int(page_size))
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.slow_rate = slow_rate
+        self.slow_ms = slow_ms
+        self._rnd = random.Random(seed)
+        self._lock = threading.Lock()
+        self.counts = {"listing": 0, "more": 0, "detail": 0, "not_found": 0, "errors": 0, "slow": 0}
+        self.server = ThreadingHTTPServer((host, port), self._handler())
+        self.server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeBoard":
+        self._thread = threading.Thread(target=self.server.serve_forever, name="fake-board", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.counts)
+
+    # ---- request handling ----
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.counts[key] += 1
+
+    def _delay(self) -> bool:
+        """Sleep the configured latency; False means "fail this request"."""
+        with self._lock:
+            roll_error, roll_slow, jitter = self._rnd.random(), self._rnd.random(), self._rnd.uniform(0, self.jitter_ms)
+        if roll_slow < self.slow_rate:
+            self._count("slow")
+            time.sleep(self.slow_ms / 1000)
+        elif self.latency_ms or jitter:
+            time.sleep((self.latency_ms + jitter) / 1000)
+        if roll_error < self.error_rate:
+            self._count("errors")
+            return False
+        return True
+
+    def _links(self, offset: int) -> tuple[str, int]:
+        end = min(self.jobs, offset + self.page_size)
+        cards = "".join(_card(job(i)) for i in range(offset + 1, end + 1))
+        return cards, (end if end < self.jobs else -1)
+
+    def _handler(self):
+        board = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, fmt, *args):  # keep load-test output clean
+                pass
+
+            def _send(self, status: int, body: str, ctype: str = "text/html; charset=utf-8"):
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", ctype)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                path = parts.path
+                if path == "/favicon.ico":
+                    return self._send(404, "")
+                if not board._delay():
+                    return self._send(503, "<h2>Service unavailable</h2>")
+                if path.startswith("/actuarial-jobs/"):
+                    try:
+                        job_id = int(path.split("/")[2].split("-")[0])
+                    except (IndexError, ValueError):
+                        job_id = 0
+                    if not 1 <= job_id <= board.jobs:
+                        board._count("not_found")
+                        return self._send(404, "<h2>Not found</h2>")
+                    board._count("detail")
+                    return self._send(200, _detail_html(job(job_id)))
+                if path == "/_more":
+                    board._count("more")
+                    offset = int((parse_qs(parts.query).get("offset") or ["0"])[0])
+                    cards, next_offset = board._links(max(0, offset))
+                    return self._send(200, json.dumps({"html": cards, "next_offset": next_offset}), "application/json")
+                board._count("listing")
+                cards, next_offset = board._links(0)
+                return self._send(200, _LISTING.format(cards=cards, next_offset=next_offset))
+
+        return Handler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve a synthetic job board for load tests")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--jobs", type=int, default=500, help="Postings on the board")
+    parser.add_argument("--page-size", type=int, default=20, help="Links per listing page / scroll batch")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Added to every response")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Random extra latency, uniform 0..N")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered 503")
+    parser.add_argument("--slow-rate", type=float, default=0.0, help="Fraction of requests delayed by --slow-ms")
+    parser.add_argument("--slow-ms", type=float, default=5000)
+    args = parser.parse_args()
+
+    board = FakeBoard(args.host, args.port, jobs=args.jobs, page_size=args.page_size,
+                      latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+                      slow_rate=args.slow_rate, slow_ms=args.slow_ms)
+    print(f"Fake board on {board.url} ({args.jobs} jobs)")
+    try:
+        board.server.serve_forever()
+    except KeyboardInterrupt:
+        board.stop()
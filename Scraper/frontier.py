@@ -0,0 +1,225 @@
+# APP/Scraper/frontier.py
+"""Local, restart-safe crawl state for the scheduled crawler.
+
+One SQLite file holds the crawl cycles, when each listing page was last
+discovered, and the URL frontier of the current cycle. A URL appears once
+per cycle however many listings link to it. Workers claim disjoint batches
+and mark them done after their items are saved, so a restarted crawler
+picks up the cycle where it stopped.
+"""
+from __future__ import annotations
+
+import os, socket, sqlite3, time
+from contextlib import contextmanager
+from typing import Dict, Iterable, List
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cycles (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at REAL NOT NULL,
+    finished_at REAL
+);
+CREATE TABLE IF NOT EXISTS listings (
+    url TEXT PRIMARY KEY,
+    last_crawled_at REAL,
+    last_cycle INTEGER
+);
+CREATE TABLE IF NOT EXISTS frontier (
+    cycle_id INTEGER NOT NULL,
+    url TEXT NOT NULL,
+    source TEXT,
+    status TEXT NOT NULL DEFAULT 'pending',
+    worker TEXT,
+    claimed_at REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (cycle_id, url)
+);
+CREATE INDEX IF NOT EXISTS ix_frontier_status ON frontier (cycle_id, status);
+"""
+
+
+def host_id() -> str:
+    return socket.gethostname()
+
+
+class Frontier:
+    def __init__(self, path: str, max_attempts: int = 2):
+        self.path = path
+        self.max_attempts = max(1, int(max_attempts))
+        d = os.path.dirname(os.path.abspath(path))
+        os.makedirs(d, exist_ok=True)
+        with self._conn() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _conn(self):
+        # A connection per call keeps this safe to share between threads
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            yield conn
+        finally:
+            conn.close()
+
+    # ---- cycles ----
+    def current_cycle(self) -> int | None:
+        with self._conn() as conn:
+            row = conn.execute(
+                "SELECT id FROM cycles WHERE finished_at IS NULL ORDER BY id DESC LIMIT 1"
+            ).fetchone()
+        return row[0] if row else None
+
+    def begin_cycle(self) -> int:
+        with self._conn() as conn:
+            return conn.execute("INSERT INTO cycles (started_at) VALUES (?)", (time.time(),)).lastrowid
+
+    def finish_cycle(self, cycle_id: int) -> None:
+        with self._conn() as conn:
+            conn.execute("UPDATE cycles SET finished_at = ? WHERE id = ?", (time.time(), cycle_id))
+
+    # ---- listings ----
+    def listing_due(self, url: str, interval_s: float, now: float | None = None) -> bool:
+        now = time.time() if now is None else now
+        with self._conn() as conn:
+            row = conn.execute("SELECT last_crawled_at FROM listings WHERE url = ?", (url,)).fetchone()
+        return not row or row[0] is None or row[0] + interval_s <= now
+
+    def listing_done_in(self, url: str, cycle_id: int) -> bool:
+        with self._conn() as conn:
+            row = conn.execute("SELECT last_cycle FROM listings WHERE url = ?", (url,)).fetchone()
+        return bool(row) and row[0] == cycle_id
+
+    def mark_listing(self, url: str, cycle_id: int) -> None:
+        with self._conn() as conn:
+            conn.execute(
+                "INSERT INTO listings (url, last_crawled_at, last_cycle) VALUES (?, ?, ?) "
+                "ON CONFLICT(url) DO UPDATE SET last_crawled_at = excluded.last_crawled_at, "
+                "last_cycle = excluded.last_cycle",
+                (url, time.time(), cycle_id),
+            )
+
+    # ---- frontier ----
+    def add(self, cycle_id: int, urls: Iterable[str], source: str | None = None) -> int:
+        """Queue URLs for this cycle; already-queued URLs are ignored."""
+        rows = [(cycle_id, u, source) for u in dict.fromkeys(urls) if u]
+        if not rows:
+            return 0
+        with self._conn() as conn:
+            before = conn.total_changes
+            conn.execute("BEGIN")
+            conn.executemany("INSERT OR IGNORE INTO frontier (cycle_id, url, source) VALUES (?, ?, ?)", rows)
+            conn.execute("COMMIT")
+            return conn.total_changes - before
+
+    def claim(self, cycle_id: int, worker: str, n: int) -> List[str]:
+        with self._conn() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            urls = [r[0] for r in conn.execute(
+                "SELECT url FROM frontier WHERE cycle_id = ? AND status = 'pending' ORDER BY rowid LIMIT ?",
+                (cycle_id, n),
+            )]
+            conn.executemany(
+                "UPDATE frontier SET status = 'claimed', worker = ?, claimed_at = ? WHERE cycle_id = ? AND url = ?",
+                [(worker, time.time(), cycle_id, u) for u in urls],
+            )
+            conn.execute("COMMIT")
+        return urls
+
+    def complete(self, cycle_id: int, urls: Iterable[str]) -> None:
+        with self._conn() as conn:
+            conn.execute("BEGIN")
+            conn.executemany(
+                "UPDATE frontier SET status = 'done', worker = NULL WHERE cycle_id = ? AND url = ?",
+                [(cycle_id, u) for u in urls],
+            )
+            conn.execute("COMMIT")
+
+    def fail(self, cycle_id: int, urls: Iterable[str]) -> None:
+        """Count a failed attempt; URLs go back to pending until max_attempts."""
+        with self._conn() as conn:
+            conn.execute("BEGIN")
+            conn.executemany(
+                "UPDATE frontier SET attempts = attempts + 1, worker = NULL, "
+                "status = CASE WHEN attempts + 1 >= ? THEN 'failed' ELSE 'pending' END "
+                "WHERE cycle_id = ? AND url = ?",
+                [(self.max_attempts, cycle_id, u) for u in urls],
+            )
+            conn.execute("COMMIT")
+
+    def release_claims(self, cycle_id: int, older_than_s: float | None = None,
+                       worker_prefix: str | None = None) -> int:
+        """Return abandoned claims (dead workers) to pending."""
+        sql = "UPDATE frontier SET status = 'pending', worker = NULL WHERE cycle_id = ? AND status = 'claimed'"
+        params: list = [cycle_id]
+        if older_than_s is not None:
+            sql += " AND claimed_at < ?"
+            params.append(time.time() - older_than_s)
+        if worker_prefix is not None:
+            sql += " AND worker LIKE ?"
+            params.append(worker_prefix + "%")
+        with self._conn() as conn:
+            return conn.execute(sql, params).rowcount
+
+    def counts(self, cycle_id: int) -> Dict[str, int]:
+        with self._conn() as conn:
+            return _counts(conn, cycle_id)
+
+    def status(self) -> Dict:
+        with self._conn() as conn:
+            return _status(conn)
+
+
+def _counts(conn, cycle_id: int) -> Dict[str, int]:
+    rows = conn.execute(
+        "SELECT status, COUNT(*) FROM frontier WHERE cycle_id = ? GROUP BY status", (cycle_id,)
+    ).fetchall()
+    out = {"pending": 0, "claimed": 0, "done": 0, "failed": 0}
+    out.update({k: v for k, v in rows})
+    return out
+
+
+def _status(conn) -> Dict:
+    last = conn.execute("SELECT id, started_at, finished_at FROM cycles ORDER BY id DESC LIMIT 1").fetchone()
+    listings = conn.execute("SELECT url, last_crawled_at, last_cycle FROM listings ORDER BY url").fetchall()
+    return {
+        "cycle": {
+            "id": last[0], "started_at": last[1], "finished_at": last[2], "frontier": _counts(conn, last[0]),
+        } if last else None,
+        "listings": [{"url": u, "last_crawled_at": t, "last_cycle": c} for u, t, c in listings],
+    }
+
+
+def read_status(path: str) -> Dict:
+    """Frontier.status() without creating or writing the state file."""
+    if not os.path.exists(path):
+        return {"cycle": None, "listings": []}
+    conn = sqlite3.connect(f"file:{os.path.abspath(path)}?mode=ro", uri=True, timeout=30)
+    try:
+        return _status(conn)
+    except sqlite3.OperationalError:  # file exists but the crawler has not created its tables yet
+        return {"cycle": None, "listings": []}
+    finally:
+        conn.close()
+
+
+def lock_crawler(path: str):
+    """Take the exclusive crawler lock for the state file at ``path``.
+
+    Returns the open lock file, which must stay referenced for as long as
+    this process runs the crawler, or None if another process holds it.
+    The OS drops the lock when the holder exits.
+    """
+    import fcntl
+    d = os.path.dirname(os.path.abspath(path))
+    os.makedirs(d, exist_ok=True)
+    fh = open(os.path.abspath(path) + ".lock", "a+")
+    try:
+        fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        fh.close()
+        return None
+    fh.seek(0)
+    fh.truncate()
+    fh.write(f"{host_id()}:{os.getpid()}\n")
+    fh.flush()
+    return fh
@@ -0,0 +1,245 @@
+# APP/Scraper/loadtest.py
+"""End-to-end scrape throughput against the local fake board (fake_board.py).
+
+Starts the fake board and an in-process backend on a throwaway SQLite
+database, runs ``scrape.run()`` against both, and prints a JSON report:
+jobs/min, time per pipeline stage, detail-page latency percentiles and the
+DB insert rate. Needs Chrome, like a real scrape.
+
+    python loadtest.py --limit 200 --latency-ms 80 --jitter-ms 40 --error-rate 0.02
+    python loadtest.py --limit 200 --no-throttle --save db
+    python loadtest.py --database-url postgresql+psycopg2://...   # measure Postgres instead
+
+The database URL is pinned before any .env is read, so a load test never
+writes to the database configured for the real app. Use the psycopg2
+driver for Postgres: bulk_load's COPY path needs it, and other drivers
+fall back to executemany.
+"""
+from __future__ import annotations
+
+import argparse, json, logging, os, sys, tempfile, threading, time
+from typing import Any, Dict, List
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.abspath(os.path.join(BASE_DIR, "..", "backend"))
+
+
+class StageTimer:
+    """Accumulated wall time and call counts per stage name."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.totals: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self.samples: Dict[str, List[float]] = {}
+
+    def add(self, stage: str, seconds: float, sample: bool = False) -> None:
+        with self._lock:
+            self.totals[stage] = self.totals.get(stage, 0.0) + seconds
+            self.calls[stage] = self.calls.get(stage, 0) + 1
+            if sample:
+                self.samples.setdefault(stage, []).append(seconds)
+
+    def wrap(self, stage: str, fn, sample: bool = False):
+        def timed(*args, **kwargs):
+            t0 = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.add(stage, time.perf_counter() - t0, sample=sample)
+        return timed
+
+    def percentile(self, stage: str, q: float) -> float | None:
+        values = sorted(self.samples.get(stage) or [])
+        if not values:
+            return None
+        return round(values[min(len(values) - 1, int(q * len(values)))], 4)
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            stage: {"seconds": round(total, 3), "calls": self.calls[stage]}
+            for stage, total in sorted(self.totals.items())
+        }
+
+
+class _TimedExtractor:
+    def __init__(self, extractor, timer: StageTimer):
+        self._extractor = extractor
+        self._timer = timer
+
+    def extract(self, *args, **kwargs):
+        t0 = time.perf_counter()
+        try:
+            return self._extractor.extract(*args, **kwargs)
+        finally:
+            self._timer.add("detail.extract", time.perf_counter() - t0)
+
+
+def _bulk_timer(wsgi_app, timer: StageTimer):
+    """Server-side time of POST /api/jobs/bulk, response body included."""
+    def app(environ, start_response):
+        if environ.get("PATH_INFO") != "/api/jobs/bulk":
+            return wsgi_app(environ, start_response)
+        t0 = time.perf_counter()
+        body = wsgi_app(environ, start_response)
+        try:
+            return [b"".join(body)]
+        finally:
+            if hasattr(body, "close"):
+                body.close()
+            timer.add("save.backend", time.perf_counter() - t0)
+    return app
+
+
+def _start_backend(timer: StageTimer):
+    from werkzeug.serving import make_server
+    from app import create_app
+
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)  # no access log in the report
+    app = create_app()
+    app.wsgi_app = _bulk_timer(app.wsgi_app, timer)
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, name="loadtest-backend", daemon=True).start()
+    return server
+
+
+def _count_jobs() -> int:
+    from sqlalchemy import select, func
+    from db import SessionLocal
+    from models.job import Job
+
+    with SessionLocal() as s:
+        return s.execute(select(func.count(Job.id))).scalar_one()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Scrape throughput against a local fake job board")
+    parser.add_argument("--limit", type=int, default=100, help="Jobs to scrape")
+    parser.add_argument("--jobs", type=int, default=0, help="Postings on the board (default: 2x limit)")
+    parser.add_argument("--page-size", type=int, default=20, help="Links per listing page / scroll batch")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Board latency per response")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Random extra board latency, uniform 0..N")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of board requests answered 503")
+    parser.add_argument("--slow-rate", type=float, default=0.0, help="Fraction of board requests delayed by --slow-ms")
+    parser.add_argument("--slow-ms", type=float, default=5000)
+    parser.add_argument("--save", choices=["api", "db"], default="api",
+                        help="api: POST to the in-process backend; db: write directly")
+    parser.add_argument("--mode", choices=["insert", "upsert"], default="insert")
+    parser.add_argument("--database-url", default="",
+                        help="Backend database (default: a fresh SQLite file in a temp dir)")
+    parser.add_argument("--no-throttle", action="store_true", help="Skip the politeness sleep between detail pages")
+    parser.add_argument("--checkpoint", default="", help="Checkpoint file, to include checkpoint writes in the run")
+    parser.add_argument("--show-browser", action="store_true", help="Run Chrome with a window")
+    parser.add_argument("--out", default="", help="Also write the JSON report to this file")
+    args = parser.parse_args()
+
+    tmpdir = tempfile.mkdtemp(prefix="loadtest-")
+    database_url = args.database_url or f"sqlite:///{os.path.join(tmpdir, 'jobs.db')}"
+    # Before scrape.py / config.py load any .env (neither overrides what is set)
+    os.environ["DATABASE_URL"] = database_url
+    os.environ["DATABASE_READ_URL"] = database_url
+    os.environ["CRAWL_SCHEDULER_ENABLED"] = "false"
+    os.environ["SCRAPER_POOL_WARM"] = "false"
+    if BACKEND_DIR not in sys.path:
+        sys.path.append(BACKEND_DIR)
+
+    import scrape
+    from checkpoint import RunCheckpoint
+    from db import init_db
+    from fake_board import FakeBoard
+
+    init_db()
+    timer = StageTimer()
+    board = FakeBoard(jobs=args.jobs or max(2 * args.limit, 40), page_size=args.page_size,
+                      latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+                      slow_rate=args.slow_rate, slow_ms=args.slow_ms).start()
+    backend = _start_backend(timer) if args.save == "api" else None
+    api_base = f"http://127.0.0.1:{backend.server_port}/api" if backend else ""
+
+    extractor_for = scrape.extractor_for
+    timed_detail = timer.wrap("detail", scrape.scrape_detail, sample=True)
+    scraped = 0
+
+    def scrape_detail(*a, **kw):
+        nonlocal scraped
+        item = timed_detail(*a, **kw)
+        scraped += bool(item)
+        return item
+
+    patched = {
+        "discover_links": timer.wrap("discover", scrape.discover_links),
+        "scrape_detail": scrape_detail,
+        "extractor_for": lambda url: _TimedExtractor(extractor_for(url), timer),
+        "chrome_driver": timer.wrap("driver_start", scrape.chrome_driver),
+        "bulk_post": timer.wrap("save", scrape.bulk_post),
+        "db_save": timer.wrap("save", scrape.db_save),
+        # Only the delay between detail pages; other waits (cookie banner, scrolling) stay real
+        "polite_pause": (lambda: None) if args.no_throttle else timer.wrap("throttle", scrape.polite_pause),
+    }
+    originals = {name: getattr(scrape, name) for name in patched}
+    for name, fn in patched.items():
+        setattr(scrape, name, fn)
+
+    rows_before = _count_jobs()
+    t0 = time.perf_counter()
+    try:
+        out = scrape.run(
+            limit=max(1, args.limit),
+            headless=not args.show_browser,
+            save_mode=args.save,
+            api_base=api_base,
+            base_url=board.url + "/",
+            bulk_mode=args.mode,
+            checkpoint=RunCheckpoint(args.checkpoint) if args.checkpoint else None,
+        )
+    finally:
+        elapsed = time.perf_counter() - t0
+        for name, fn in originals.items():
+            setattr(scrape, name, fn)
+        board.stop()
+        if backend:
+            backend.shutdown()
+
+    summary = out["summary"]
+    stages = timer.report()
+    detail_s = timer.totals.get("detail", 0.0)
+    extract_s = timer.totals.get("detail.extract", 0.0)
+    if "detail" in stages:
+        # Navigation, wait and HTML parse: everything in scrape_detail but extraction
+        stages["detail.load"] = {"seconds": round(detail_s - extract_s, 3), "calls": timer.calls["detail"]}
+        stages = dict(sorted(stages.items()))
+    inserted = int(summary.get("inserted", 0))
+    db_s = timer.totals.get("save.backend") or timer.totals.get("save")
+    report = {
+        "config": {
+            "limit": args.limit, "board_jobs": board.jobs, "latency_ms": args.latency_ms,
+            "jitter_ms": args.jitter_ms, "error_rate": args.error_rate, "slow_rate": args.slow_rate,
+            "save": args.save, "mode": args.mode, "throttle": not args.no_throttle,
+            "database": database_url.split("://", 1)[0],
+        },
+        "elapsed_s": round(elapsed, 3),
+        "jobs_scraped": scraped,
+        "jobs_per_min": round(scraped / elapsed * 60, 1) if elapsed else None,
+        "stages": stages,
+        "detail_latency_s": {
+            "p50": timer.percentile("detail", 0.5),
+            "p95": timer.percentile("detail", 0.95),
+            "max": timer.percentile("detail", 1.0),
+        },
+        "save": {
+            **summary,
+            "db_rows_added": _count_jobs() - rows_before,
+            "inserts_per_s": round(inserted / db_s, 1) if db_s else None,
+            "bulk_timing": out.get("timing"),
+        },
+        "board": board.stats(),
+    }
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
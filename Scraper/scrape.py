@@ -3,12 +3,11 @@
 
 from __future__ import annotations
 
-import os, re, time, random, argparse, json
+import os, re, sys, time, random, argparse, json, threading
 from datetime import datetime, timedelta, timezone, date
 from typing import List, Dict, Any, Set, Optional
 
 from dotenv import load_dotenv
-import requests
 from bs4 import BeautifulSoup
 
 from selenium import webdriver
@@ -19,6 +18,9 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
 
+from checkpoint import RunCheckpoint
+from extractors import Extractor, extractor_for, register
+
 # ---------- ENV ----------
 def _try_load_env(path: str):
     if os.path.exists(path):
@@ -33,8 +35,25 @@ DEFAULT_BASE_URL = "https://www.actuarylist.com"
 DEFAULT_API_BASE = os.getenv("VITE_API_BASE") or os.getenv("REACT_APP_API_BASE") or "http://localhost:5000"
 DEFAULT_API = DEFAULT_API_BASE.rstrip("/") + "/api"
 
+# 0 keeps the full description; the backend stores it off the list path.
+DESCRIPTION_MAX_CHARS = int(os.getenv("SCRAPER_DESCRIPTION_MAX_CHARS", "0"))
+
+# Checkpoints for resumable runs (checkpoint.py)
+DEFAULT_CHECKPOINT_PATH = os.getenv("SCRAPE_CHECKPOINT_PATH", os.path.join(BASE_DIR, ".scrape_runs.sqlite3"))
+
 DETAIL_HREF_RE = re.compile(r"/actuarial-jobs/\d+[-/]", re.I)
 
+# Resources we never read; blocked at the network layer via CDP.
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.avif",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.mp3", "*.m4a", "*.ogg",
+    "*googletagmanager.com*", "*google-analytics.com*", "*doubleclick.net*",
+    "*googlesyndication.com*", "*facebook.net*", "*facebook.com/tr*",
+    "*hotjar.com*", "*clarity.ms*", "*intercom.io*", "*segment.io*",
+    "*fonts.googleapis.com*", "*fonts.gstatic.com*", "*youtube.com*", "*vimeo.com*",
+]
+
 # For sanity filtering of bogus "tags"
 _BAD_TAG_PHRASES = {
     "open menu", "copy link", "get started", "get free job alerts",
@@ -60,6 +79,24 @@ def parse_relative_time(text: str) -> date | None:
     delta_days = 0 if unit == "h" else qty if unit == "d" else qty*7 if unit == "w" else qty*30 if unit == "mo" else qty*365
     return (datetime.now(timezone.utc) - timedelta(days=delta_days)).date()
 
+_driver_path: str | None = None
+_driver_path_lock = threading.Lock()
+
+def resolve_driver_path() -> str:
+    """Resolve the chromedriver binary once per process (CHROMEDRIVER_PATH wins)."""
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None:
+            _driver_path = os.getenv("CHROMEDRIVER_PATH") or ChromeDriverManager().install()
+        return _driver_path
+
+def block_resources(driver: webdriver.Chrome, patterns: list[str] | None = None) -> None:
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns or BLOCKED_URL_PATTERNS})
+    except Exception:
+        pass
+
 def chrome_driver(headless: bool = True) -> webdriver.Chrome:
     options = ChromeOptions()
     if headless:
@@ -70,12 +107,149 @@ def chrome_driver(headless: bool = True) -> webdriver.Chrome:
     options.add_argument("--window-size=1366,900")
     options.add_argument("--lang=en-US")
     options.add_argument("--disable-blink-features=AutomationControlled")
-    service = ChromeService(ChromeDriverManager().install())
+    options.add_argument("--disable-extensions")
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    })
+    # Every caller waits for its own selectors, so don't block on subresources.
+    options.page_load_strategy = "eager"
+    service = ChromeService(resolve_driver_path())
     driver = webdriver.Chrome(service=service, options=options)
     driver.set_page_load_timeout(40)
+    driver.set_script_timeout(30)
     driver.implicitly_wait(0)
+    block_resources(driver)
     return driver
 
+def driver_is_healthy(driver: webdriver.Chrome) -> bool:
+    try:
+        return driver.execute_script("return 1;") == 1
+    except Exception:
+        return False
+
+def _quit_quietly(driver: webdriver.Chrome) -> None:
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+class DriverPool:
+    """Size-limited pool of warm Chrome drivers reused across scrape runs.
+
+    Drivers are health-checked on checkout and recycled once they have
+    loaded ``max_pages`` pages, which keeps Chrome's memory in check.
+    """
+
+    def __init__(self, size: int = 1, max_pages: int = 200, headless: bool = True):
+        self.size = max(1, int(size))
+        self.max_pages = max(1, int(max_pages))
+        self.headless = headless
+        self._idle: list[tuple[webdriver.Chrome, int]] = []
+        self._pages: dict[int, int] = {}
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._lock = threading.Lock()
+        self._starting = 0  # drivers being created right now
+        self._created = 0
+        self._recycled = 0
+
+    def _live(self) -> int:
+        # Callers hold self._lock
+        return len(self._idle) + len(self._pages) + self._starting
+
+    def _new_driver(self) -> webdriver.Chrome:
+        # The caller has counted it in self._starting and files it as idle or in use
+        try:
+            return chrome_driver(headless=self.headless)
+        except Exception:
+            with self._lock:
+                self._starting -= 1
+            raise
+
+    def _park(self, driver: webdriver.Chrome, pages: int, started: bool = False) -> None:
+        with self._lock:
+            if started:
+                self._starting -= 1
+                self._created += 1
+            if self._live() < self.size:
+                self._idle.append((driver, pages))
+                return
+        # A warm-up raced acquire(): the pool is full, so drop the extra
+        _quit_quietly(driver)
+
+    def warm(self) -> None:
+        """Start idle drivers until ``size`` are live (idle, in use or starting)."""
+        resolve_driver_path()
+        while True:
+            with self._lock:
+                if self._live() >= self.size:
+                    return
+                self._starting += 1  # reserve the place before creating
+            self._park(self._new_driver(), 0, started=True)
+
+    def acquire(self, timeout: float | None = None) -> webdriver.Chrome:
+        if not self._slots.acquire(timeout=timeout):
+            raise RuntimeError("No Chrome driver available in pool")
+        try:
+            while True:
+                with self._lock:
+                    if not self._idle:
+                        break
+                    driver, pages = self._idle.pop()
+                if driver_is_healthy(driver):
+                    with self._lock:
+                        self._pages[id(driver)] = pages
+                    return driver
+                _quit_quietly(driver)
+                with self._lock:
+                    self._recycled += 1
+            with self._lock:
+                self._starting += 1
+            driver = self._new_driver()
+            with self._lock:
+                self._starting -= 1
+                self._created += 1
+                self._pages[id(driver)] = 0
+            return driver
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, driver: webdriver.Chrome, pages: int = 0) -> None:
+        with self._lock:
+            total = self._pages.pop(id(driver), 0) + max(0, int(pages))
+        try:
+            if total >= self.max_pages or not driver_is_healthy(driver):
+                _quit_quietly(driver)
+                with self._lock:
+                    self._recycled += 1
+            else:
+                try:
+                    driver.delete_all_cookies()
+                except Exception:
+                    pass
+                self._park(driver, total)
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for driver, _ in idle:
+            _quit_quietly(driver)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": self.size,
+                "idle": len(self._idle),
+                "in_use": len(self._pages),
+                "starting": self._starting,
+                "created": self._created,
+                "recycled": self._recycled,
+                "max_pages": self.max_pages,
+            }
+
 def try_accept_cookies(driver: webdriver.Chrome, timeout: int = 6) -> None:
     texts = ["accept", "agree", "got it", "i accept", "allow"]
     end = time.time() + timeout
@@ -89,48 +263,85 @@ def try_accept_cookies(driver: webdriver.Chrome, timeout: int = 6) -> None:
             pass
         time.sleep(0.5)
 
-def collect_job_links(driver: webdriver.Chrome) -> List[str]:
-    anchors = driver.find_elements(By.XPATH, "//a[contains(@href, '/actuarial-jobs/')]")
-    hrefs: list[str] = []
-    for a in anchors:
-        try:
-            href = a.get_attribute("href") or ""
-            if DETAIL_HREF_RE.search(href) and href not in hrefs:
-                hrefs.append(href)
-        except Exception:
-            continue
-    return hrefs
+# Matching detail links, deduplicated in page order; arguments[0] is the
+# DETAIL_HREF_RE pattern. Shared by both scripts below.
+_HARVEST_JS = """
+const re = new RegExp(arguments[0], "i");
+const harvest = () => {
+    const seen = new Set();
+    for (const a of document.querySelectorAll("a[href*='/actuarial-jobs/']")) {
+        const href = a.href || "";
+        if (re.test(href)) seen.add(href);
+    }
+    return Array.from(seen);
+};
+"""
+
+# Harvest the links in one round trip.
+_COLLECT_LINKS_JS = _HARVEST_JS + "return harvest();\n"
+
+# Scroll to the bottom and resolve as soon as a MutationObserver sees new
+# detail anchors (after a short settle so a whole batch lands), or on timeout.
+_SCROLL_AND_WAIT_JS = _HARVEST_JS + """
+const timeoutMs = arguments[1], settleMs = arguments[2];
+const done = arguments[arguments.length - 1];
+const isLink = (n) => n.nodeType === 1 && (
+    (n.matches && n.matches("a[href*='/actuarial-jobs/']")) ||
+    (n.querySelector && n.querySelector("a[href*='/actuarial-jobs/']"))
+);
+let finished = false, settle = null;
+const finish = () => {
+    if (finished) return;
+    finished = true;
+    obs.disconnect();
+    clearTimeout(timer);
+    done(harvest());
+};
+const obs = new MutationObserver((mutations) => {
+    for (const m of mutations) {
+        for (const n of m.addedNodes) {
+            if (isLink(n)) {
+                if (!settle) settle = setTimeout(finish, settleMs);
+                return;
+            }
+        }
+    }
+});
+obs.observe(document.body, {childList: true, subtree: true});
+const timer = setTimeout(finish, timeoutMs);
+window.scrollTo(0, document.body.scrollHeight);
+"""
 
-def smooth_scroll(driver: webdriver.Chrome, step_px: int = 600, pause: float = 0.35):
-    driver.execute_script("window.scrollBy(0, arguments[0]);", step_px)
-    time.sleep(pause + random.uniform(0.05, 0.15))
+def collect_job_links(driver: webdriver.Chrome) -> List[str]:
+    try:
+        return list(driver.execute_script(_COLLECT_LINKS_JS, DETAIL_HREF_RE.pattern) or [])
+    except Exception:
+        return []
 
-def scroll_until_enough(driver: webdriver.Chrome, want: int, max_scrolls: int = 40) -> None:
-    last_count = 0
+def scroll_until_enough(driver: webdriver.Chrome, want: int, max_scrolls: int = 40,
+                        wait_ms: int = 4000, settle_ms: int = 250, max_stalls: int = 3) -> List[str]:
+    """Scroll until ``want`` detail links are on the page; returns the links."""
+    links = collect_job_links(driver)
+    stalls = 0
     for _ in range(max_scrolls):
-        smooth_scroll(driver)
-        links = collect_job_links(driver)
         if len(links) >= want:
-            return
-        if len(links) == last_count:
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(0.8)
-        last_count = len(links)
-
-def soup_text_or_none(soup: BeautifulSoup, selectors: list[str]) -> str | None:
-    for sel in selectors:
-        el = soup.select_one(sel)
-        if el and el.get_text(strip=True):
-            return el.get_text(strip=True)
-    return None
-
-def soup_all_texts(soup: BeautifulSoup, selectors: list[str]) -> List[str]:
-    out: list[str] = []
-    for sel in selectors:
-        for el in soup.select(sel):
-            t = el.get_text(strip=True)
-            if t: out.append(t)
-    return out
+            break
+        try:
+            found = driver.execute_async_script(
+                _SCROLL_AND_WAIT_JS, DETAIL_HREF_RE.pattern, wait_ms, settle_ms
+            ) or []
+        except Exception:
+            found = collect_job_links(driver)
+        # Union keeps links a virtualised list may have dropped from the DOM.
+        merged = list(dict.fromkeys([*links, *found]))
+        if len(merged) == len(links):
+            stalls += 1
+            if stalls >= max_stalls:
+                break
+        else:
+            stalls = 0
+            links = merged
+    return links
 
 # ---- Description helpers ----
 def _strip_html(html: str) -> str:
@@ -139,7 +350,10 @@ def _strip_html(html: str) -> str:
     except Exception:
         return html
 
-def extract_description(soup: BeautifulSoup) -> str | None:
+def _clip(text: str, max_chars: int) -> str:
+    return text[:max_chars] if max_chars > 0 else text
+
+def extract_description(soup: BeautifulSoup, max_chars: int = DESCRIPTION_MAX_CHARS) -> str | None:
     # 1) JSON-LD description first
     for sc in soup.find_all("script", attrs={"type": "application/ld+json"}):
         try:
@@ -155,7 +369,7 @@ def extract_description(soup: BeautifulSoup) -> str | None:
                 if desc and isinstance(desc, str):
                     text = _strip_html(desc)
                     if text:
-                        return text[:1200]
+                        return _clip(text, max_chars)
     # 2) Content blocks
     selectors = [
         "article", ".job-content", "[class*=description]", "[class*=content]",
@@ -172,7 +386,7 @@ def extract_description(soup: BeautifulSoup) -> str | None:
     if not chunks:
         return None
     desc = " ".join(chunks)
-    return desc[:1200]
+    return _clip(desc, max_chars)
 
 # ---- Location helpers ----
 def _looks_like_country_code(s: str) -> bool:
@@ -308,8 +522,61 @@ def collect_tags(soup: BeautifulSoup) -> list[str]:
             seen.add(t); uniq.append(t)
     return uniq[:12]
 
+# ---------- EXTRACTORS ----------
+class ActuaryListExtractor(Extractor):
+    """actuarylist.com job pages (also the fallback for unregistered hosts)."""
+
+    name = "actuarylist"
+    domains = ("actuarylist.com",)
+    fields = {
+        "title": ["h1", "h1.job-title", "h1[class*=title]", "header h1"],
+        "company": ["[class*=company] a", "[class*=company]", "div.company", "span.company"],
+        "posted": ["[class*=posted]", "[class*=time]", "time", "span.time", "span.posted"],
+        "salary": ["[class*=salary]", ".salary", "span.salary", "div.salary"],
+        "job_type": ["[class*=job-type]", ".job-type", "span.job-type"],
+    }
+
+    def extract(self, soup: BeautifulSoup, url: str,
+                description_max_chars: int = DESCRIPTION_MAX_CHARS) -> Dict[str, Any] | None:
+        found = self.plan.extract(soup)
+
+        # Title & Company
+        title = (found["title"] or "").strip()
+        if not title:
+            return None
+        # Company: derive from slug if not shown
+        company = found["company"] or ""
+        if not company:
+            m = re.search(r"/actuarial-jobs/\d+-([a-z0-9\-]+)", url)
+            if m:
+                slug = m.group(1)
+                company = " ".join(part.capitalize() for part in slug.split("-"))
+        company = (company or "Unknown").strip()
+
+        # Location (robust)
+        location = collect_location(soup) or "Unknown"
+
+        # Dates / type / salary
+        posting_date = parse_relative_time(found["posted"]) if found["posted"] else None
+        job_type = found["job_type"] or "Full-time"
+
+        return {
+            "title": title,
+            "company": company,
+            "location": location,
+            "description": extract_description(soup, max_chars=description_max_chars),
+            "posting_date": posting_date.isoformat() if posting_date else None,
+            "job_type": job_type,
+            "tags": collect_tags(soup),
+            "salary_text": found["salary"],
+            "source_url": url,
+        }
+
+register(ActuaryListExtractor(), default=True)
+
 # ---------- MAIN DETAIL EXTRACTOR ----------
-def scrape_detail(driver: webdriver.Chrome, url: str) -> Dict[str, Any] | None:
+def scrape_detail(driver: webdriver.Chrome, url: str,
+                  description_max_chars: int = DESCRIPTION_MAX_CHARS) -> Dict[str, Any] | None:
     try:
         driver.get(url)
     except Exception:
@@ -326,132 +593,155 @@ def scrape_detail(driver: webdriver.Chrome, url: str) -> Dict[str, Any] | None:
 
     html = driver.page_source
     soup = BeautifulSoup(html, "html.parser")
-
-    # Title & Company
-    title = soup_text_or_none(soup, ["h1","h1.job-title","h1[class*=title]","header h1"]) or ""
-    title = title.strip()
-    # Company: derive from slug if not shown
-    company = soup_text_or_none(soup, ["[class*=company] a","[class*=company]","div.company","span.company"]) or ""
-    if not company:
-        m = re.search(r"/actuarial-jobs/\d+-([a-z0-9\-]+)", url)
-        if m:
-            slug = m.group(1)
-            company = " ".join(part.capitalize() for part in slug.split("-"))
-    company = (company or "Unknown").strip()
-
-    # Location (robust)
-    location = collect_location(soup) or "Unknown"
-
-    # Dates / type / salary
-    rel = soup_text_or_none(soup, ["[class*=posted]","[class*=time]","time","span.time","span.posted"])
-    posting_date = parse_relative_time(rel) if rel else None
-    salary_text = soup_text_or_none(soup, ["[class*=salary]",".salary","span.salary","div.salary"])
-    job_type = soup_text_or_none(soup, ["[class*=job-type]",".job-type","span.job-type"]) or "Full-time"
-
-    # Tags & Description
-    tags = collect_tags(soup)
-    description = extract_description(soup)
-
-    if not title:
-        return None
-
-    return {
-        "title": title,
-        "company": company,
-        "location": location,
-        "description": description,
-        "posting_date": posting_date.isoformat() if posting_date else None,
-        "job_type": job_type,
-        "tags": tags,
-        "salary_text": salary_text,
-        "source_url": url,
-    }
-
-def bulk_post(api_base: str, items: List[Dict[str, Any]]) -> Dict[str, Any]:
-    url = api_base.rstrip("/") + "/jobs/bulk"
-    CHUNK = 50
-    total_inserted = total_skipped = total_invalid = total_failed = 0
-    details: list[Any] = []
-
-    for i in range(0, len(items), CHUNK):
-        chunk = items[i:i+CHUNK]
-        try:
-            r = requests.post(url, json={"items": chunk}, timeout=90)
-            if r.status_code >= 400:
-                details.append({"range": [i, i+len(chunk)-1], "status": r.status_code, "body": r.text})
-            else:
-                data = r.json()
-                summary = data.get("summary", {}) or {}
-                total_inserted += int(summary.get("inserted", 0))
-                total_skipped  += int(summary.get("skipped", 0))
-                total_invalid  += int(summary.get("invalid", 0))
-                total_failed   += int(summary.get("failed", 0))
-                if "results" in data:
-                    details.extend(data["results"])
-        except Exception as e:
-            details.append({"range": [i, i+len(chunk)-1], "error": str(e)})
-        time.sleep(0.4)
-
-    return {
-        "summary": {
-            "inserted": total_inserted,
-            "skipped": total_skipped,
-            "invalid": total_invalid,
-            "failed": total_failed,
-        },
-        "results": details,
-    }
+    return extractor_for(url).extract(soup, url, description_max_chars=description_max_chars)
+
+def bulk_post(api_base: str, items: List[Dict[str, Any]], mode: str = "insert",
+              listed_urls: List[str] | None = None) -> Dict[str, Any]:
+    """POST items to /jobs/bulk over one pooled, gzip-compressed session (see bulk_client.py)."""
+    from bulk_client import BulkClient  # reads SCRAPER_BULK_* after .env is loaded
+    with BulkClient(api_base) as client:
+        return client.post(items, mode=mode, listed_urls=listed_urls)
+
+def db_save(items: List[Dict[str, Any]], mode: str = "insert",
+            listed_urls: List[str] | None = None) -> Dict[str, Any]:
+    """Write straight to the backend database (COPY on Postgres, executemany elsewhere).
+
+    The schema must already exist (``python manage.py init-db``).
+    """
+    backend_dir = os.path.abspath(os.path.join(BASE_DIR, "..", "backend"))
+    if backend_dir not in sys.path:
+        sys.path.append(backend_dir)
+    from bulk_load import save_jobs  # backend/bulk_load.py; needs DATABASE_URL
+    return save_jobs(items, mode=mode, listed_urls=listed_urls)
 
 # ---------- MAIN SCRAPE FLOW ----------
-def run(limit: int, headless: bool, save_mode: str, api_base: str, base_url: str, on_progress=None):
-    driver = chrome_driver(headless=headless)
-    collected: Set[str] = set()
+def discover_links(driver: webdriver.Chrome, listing_url: str, want: int, max_scrolls: int = 60) -> List[str]:
+    """Open a listing page and scroll until ``want`` detail links are visible."""
+    driver.get(listing_url)
+    try_accept_cookies(driver)
+    WebDriverWait(driver, 15).until(
+        EC.presence_of_element_located((By.XPATH, "//a[contains(@href, '/actuarial-jobs/')]"))
+    )
+    # Listing shows a finite set per page; this still gives us 20–40 fast.
+    return scroll_until_enough(driver, want=want, max_scrolls=max_scrolls)
+
+def run(limit: int, headless: bool, save_mode: str, api_base: str, base_url: str, on_progress=None,
+        driver_pool: DriverPool | None = None, description_max_chars: int = DESCRIPTION_MAX_CHARS,
+        bulk_mode: str = "insert", checkpoint: RunCheckpoint | None = None, resume: int | None = None,
+        on_start=None, run_id: int | None = None):
+    """Scrape up to ``limit`` jobs from ``base_url`` and save them.
+
+    With a ``checkpoint``, the link list and every finished URL (with its item)
+    are recorded as the run goes; ``resume=<run id>`` continues such a run,
+    taking base_url/limit/mode from the checkpoint. ``run_id`` is a fresh run
+    the caller already began with ``checkpoint.begin()``.
+    """
+    done: Set[str] = set()
     results: List[Dict[str, Any]] = []
+    all_links: List[str] = []
+    if checkpoint is not None:
+        if resume is not None:
+            saved = checkpoint.get(resume)
+            if saved is None:
+                raise ValueError(f"Unknown scrape run {resume}")
+            run_id, base_url, limit, bulk_mode = saved["id"], saved["base_url"], saved["limit"], saved["mode"]
+            all_links = checkpoint.links(run_id)
+            done = checkpoint.skip_urls(run_id)
+            results = checkpoint.items(run_id)
+            checkpoint.set_status(run_id, "running")
+            print(f"Resuming run {run_id}: {len(results)} scraped, {len(all_links)} links known")
+        else:
+            if run_id is None:
+                run_id = checkpoint.begin(base_url, limit, bulk_mode)
+            print(f"Scrape run {run_id} (checkpoint: {checkpoint.path})")
+    else:
+        run_id = None
+    if on_start:
+        on_start(run_id, limit)
+    if on_progress and results:
+        on_progress(len(results), limit)
 
     try:
-        driver.get(base_url)
-        try_accept_cookies(driver)
-        WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located((By.XPATH, "//a[contains(@href, '/actuarial-jobs/')]"))
-        )
-        target = max(20, limit)
-        # Listing shows a finite set per page; this still gives us 20–40 fast.
-        scroll_until_enough(driver, want=target, max_scrolls=60)
-        all_links = collect_job_links(driver)
+        if len(results) < limit:
+            _scrape_links(run_id, checkpoint, limit, headless, base_url, all_links, done, results,
+                          on_progress, driver_pool, description_max_chars)
+        print(f"Total scraped (pre-dedupe by backend): {len(results)}")
+
+        if not results:
+            summary = {"summary": {"inserted": 0, "skipped": 0, "invalid": 0, "failed": 0}}
+        elif save_mode == "api":
+            # Every discovered link counts as still listed, scraped or not
+            summary = bulk_post(api_base, results, mode=bulk_mode, listed_urls=all_links)
+        else:
+            summary = db_save(results, mode=bulk_mode, listed_urls=all_links)
+    except Exception as e:
+        if run_id is not None:
+            checkpoint.set_status(run_id, "failed", error=str(e))
+        raise
+    if run_id is not None:
+        checkpoint.set_status(run_id, "done", summary=summary["summary"])
+        summary["run_id"] = run_id
+    print("Bulk summary:", summary["summary"])
+    return summary
+
+def polite_pause() -> None:
+    """Delay between detail pages, to stay gentle on the source site."""
+    time.sleep(0.4 + random.uniform(0.05, 0.2))
+
+def _scrape_links(run_id, checkpoint, limit, headless, base_url, all_links, done, results,
+                  on_progress, driver_pool, description_max_chars) -> None:
+    driver = driver_pool.acquire() if driver_pool else chrome_driver(headless=headless)
+    pages = 0
+    try:
         if not all_links:
-            print("No job links found on the home page.")
-            return {"summary": {"inserted": 0, "skipped": 0, "invalid": 0, "failed": 0}}
+            all_links[:] = discover_links(driver, base_url, want=max(20, limit))
+            pages += 1
+            if not all_links:
+                print("No job links found on the home page.")
+                return
+            if run_id is not None:
+                checkpoint.save_links(run_id, all_links)
 
         for href in all_links:
             if len(results) >= limit:
                 break
-            if href in collected:
+            if href in done:
                 continue
-            item = scrape_detail(driver, href)
+            try:
+                item = scrape_detail(driver, href, description_max_chars=description_max_chars)
+            except Exception as e:
+                print(f"{href}: {e}")
+                item = None
+            # scrape_detail swallows navigation errors, so a crashed Chrome
+            # usually shows up as a None item rather than an exception
+            if not item and not driver_is_healthy(driver):
+                print(f"{href}: browser not responding, starting a new one")
+                if driver_pool:
+                    driver_pool.release(driver, pages=driver_pool.max_pages)
+                else:
+                    _quit_quietly(driver)
+                # Not ours any more: if starting a new one fails, finally must not release it again
+                driver, pages = None, 0
+                driver = driver_pool.acquire() if driver_pool else chrome_driver(headless=headless)
+            pages += 1
+            done.add(href)
             if not item:
+                if run_id is not None:
+                    checkpoint.fail(run_id, href)
                 continue
-            collected.add(href)
             results.append(item)
+            if run_id is not None:
+                checkpoint.finish(run_id, href, item)
             if on_progress:
                 on_progress(len(results), limit)
             if len(results) % 10 == 0:
                 print(f"Scraped {len(results)} jobs...")
-            time.sleep(0.4 + random.uniform(0.05, 0.2))
+            polite_pause()
     finally:
-        try:
-            driver.quit()
-        except Exception:
-            pass
-
-    print(f"Total scraped (pre-dedupe by backend): {len(results)}")
-
-    if save_mode == "api":
-        summary = bulk_post(api_base, results)
-        print("Bulk summary:", summary)
-        return summary
-    else:
-        print("Direct DB save not implemented in this variant. Use --save api (default).")
-        return {"summary": {"inserted": len(results), "skipped": 0, "invalid": 0, "failed": 0}}
+        if driver is not None and driver_pool:
+            driver_pool.release(driver, pages=pages)
+        elif driver is not None:
+            _quit_quietly(driver)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
@@ -460,6 +750,13 @@ if __name__ == "__main__":
     parser.add_argument("--save", choices=["api", "db"], default="api", help="Where to save scraped jobs")
     parser.add_argument("--api-base", type=str, default=DEFAULT_API, help="API base, e.g., http://localhost:5000/api")
     parser.add_argument("--base-url", type=str, default=DEFAULT_BASE_URL, help="Actuary List base URL")
+    parser.add_argument("--mode", choices=["insert", "upsert"], default="insert",
+                        help="insert skips known jobs; upsert rewrites jobs whose content changed")
+    parser.add_argument("--description-chars", type=int, default=DESCRIPTION_MAX_CHARS,
+                        help="Truncate descriptions to N characters (0 = keep full text)")
+    parser.add_argument("--checkpoint", type=str, default=DEFAULT_CHECKPOINT_PATH,
+                        help="State file for resumable runs ('' disables checkpointing)")
+    parser.add_argument("--resume", type=int, default=None, help="Continue the checkpointed run with this id")
     args = parser.parse_args()
 
     out = run(
@@ -468,5 +765,9 @@ if __name__ == "__main__":
         save_mode=args.save,
         api_base=args.api_base,
         base_url=args.base_url,
+        description_max_chars=args.description_chars,
+        bulk_mode=args.mode,
+        checkpoint=RunCheckpoint(args.checkpoint) if args.checkpoint else None,
+        resume=args.resume,
     )
     print("Bulk summary:", out)
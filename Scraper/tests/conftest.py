@@ -0,0 +1,4 @@
+import os, sys
+
+# Scraper modules are run as scripts (no package); make them importable
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,73 @@
+"""CrawlScheduler workers against a real Frontier file and fake drivers."""
+import pytest
+
+import crawler
+import scrape
+from crawler import CrawlScheduler
+from frontier import Frontier
+
+from test_driver_pool import FakeDriver
+
+URLS = [f"http://board/actuarial-jobs/{i}-acme" for i in range(1, 5)]
+
+
+@pytest.fixture
+def frontier(tmp_path):
+    return Frontier(str(tmp_path / "crawl.sqlite3"))
+
+
+@pytest.fixture
+def no_pause(monkeypatch):
+    monkeypatch.setattr(crawler, "polite_pause", lambda: None)
+
+
+def statuses(frontier, cycle):
+    with frontier._conn() as conn:
+        return dict(conn.execute("SELECT url, status FROM frontier WHERE cycle_id = ?", (cycle,)).fetchall())
+
+
+def test_failed_save_retries_then_fails_instead_of_staying_claimed(frontier, monkeypatch, no_pause):
+    monkeypatch.setattr(scrape, "chrome_driver", lambda headless=True: FakeDriver())
+    monkeypatch.setattr(crawler, "scrape_detail", lambda driver, url, **kw: {"title": "T", "source_url": url})
+
+    saves = []
+
+    def save(items):
+        saves.append(len(items))
+        raise RuntimeError("database is down")
+
+    sched = CrawlScheduler([], frontier, save, workers=1, claim_size=2, save_batch=2)
+    cycle = frontier.begin_cycle()
+    frontier.add(cycle, URLS)
+    sched._worker(cycle, "w0")  # must not raise
+
+    # Each failed save puts the batch back to pending; the worker retries it
+    # and the second failure (max_attempts=2) marks it failed
+    assert set(statuses(frontier, cycle).values()) == {"failed"}
+    assert saves == [2, 2, 2, 2]
+    assert sched.pool.stats()["in_use"] == 0
+
+
+def test_replacement_browser_failure_hands_claims_back(frontier, monkeypatch, no_pause):
+    made = []
+
+    def chrome_driver(headless=True):
+        if made:
+            raise RuntimeError("no chrome")
+        made.append(FakeDriver())
+        return made[-1]
+
+    def dying_detail(driver, url, **kw):
+        driver.quit()
+        return None
+
+    monkeypatch.setattr(scrape, "chrome_driver", chrome_driver)
+    monkeypatch.setattr(crawler, "scrape_detail", dying_detail)
+    sched = CrawlScheduler([], frontier, lambda items: None, workers=1, claim_size=4)
+    cycle = frontier.begin_cycle()
+    frontier.add(cycle, URLS)
+    sched._worker(cycle, "w0")  # no "Semaphore released too many times"
+
+    assert "claimed" not in statuses(frontier, cycle).values()
+    stats = sched.pool.stats()
+    assert stats["in_use"] == 0 and stats["recycled"] == 1
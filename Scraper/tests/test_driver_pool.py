@@ -0,0 +1,102 @@
+"""DriverPool bookkeeping with fake drivers (no Chrome needed)."""
+import threading, time
+
+import pytest
+
+import scrape
+from scrape import DriverPool
+
+
+class FakeDriver:
+    def __init__(self):
+        self.quit_called = False
+
+    def execute_script(self, script, *args):
+        if self.quit_called:
+            raise RuntimeError("session deleted")
+        return 1
+
+    def delete_all_cookies(self):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def fake_chrome(monkeypatch):
+    made = []
+
+    def chrome_driver(headless=True):
+        time.sleep(0.05)  # long enough for warm() and acquire() to overlap
+        made.append(FakeDriver())
+        return made[-1]
+
+    monkeypatch.setattr(scrape, "chrome_driver", chrome_driver)
+    monkeypatch.setattr(scrape, "resolve_driver_path", lambda: None)
+    return made
+
+
+def test_warm_fills_to_size(fake_chrome):
+    pool = DriverPool(size=3)
+    pool.warm()
+    pool.warm()
+    assert len(fake_chrome) == 3
+    assert pool.stats()["idle"] == 3
+
+
+def test_warm_racing_acquire_never_parks_more_than_size(fake_chrome):
+    pool = DriverPool(size=2)
+    got = []
+    threads = [threading.Thread(target=pool.warm)] + [
+        threading.Thread(target=lambda: got.append(pool.acquire())) for _ in range(2)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    for d in got:
+        pool.release(d, pages=1)
+
+    stats = pool.stats()
+    live = [d for d in fake_chrome if not d.quit_called]
+    assert stats["idle"] <= pool.size and stats["in_use"] == 0 and stats["starting"] == 0
+    assert len(live) == stats["idle"]
+
+
+def test_failed_creation_frees_its_place(monkeypatch):
+    def broken(headless=True):
+        raise RuntimeError("no chrome")
+
+    monkeypatch.setattr(scrape, "chrome_driver", broken)
+    pool = DriverPool(size=1)
+    with pytest.raises(RuntimeError):
+        pool.acquire(timeout=1)
+    assert pool.stats()["starting"] == 0
+    with pytest.raises(RuntimeError, match="no chrome"):
+        pool.acquire(timeout=1)  # the slot was handed back too
+
+
+def test_dead_driver_replacement_failure_surfaces_chrome_error(monkeypatch):
+    # The first driver dies mid-run and no new one can start: the run must
+    # report the start error, not release the recycled driver a second time
+    made = []
+
+    def chrome_driver(headless=True):
+        if made:
+            raise RuntimeError("no chrome")
+        made.append(FakeDriver())
+        return made[-1]
+
+    def dying_detail(driver, url, **options):
+        driver.quit()
+        return None
+
+    monkeypatch.setattr(scrape, "chrome_driver", chrome_driver)
+    monkeypatch.setattr(scrape, "scrape_detail", dying_detail)
+    pool = DriverPool(size=1)
+    with pytest.raises(RuntimeError, match="no chrome"):
+        scrape._scrape_links(None, None, 5, True, "http://board", ["http://board/a", "http://board/b"],
+                             set(), [], None, pool, 0)
+    stats = pool.stats()
+    assert stats["in_use"] == 0 and stats["idle"] == 0 and stats["recycled"] == 1
@@ -0,0 +1,151 @@
+"""ActuaryListExtractor / SelectorPlan against saved detail pages (tests/fixtures)."""
+import os
+
+import pytest
+from bs4 import BeautifulSoup
+
+import extractors
+from extractors import Extractor, SelectorPlan, extractor_for
+from scrape import ActuaryListExtractor, parse_relative_time
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+PAGES = ["actuarylist_pricing", "actuarylist_reserving", "actuarylist_plain_company", "actuarylist_empty_h1"]
+FIELDS = ActuaryListExtractor.fields
+
+
+def soup_for(name: str) -> BeautifulSoup:
+    with open(os.path.join(FIXTURES, name + ".html"), encoding="utf-8") as f:
+        return BeautifulSoup(f.read(), "html.parser")
+
+
+def first_hit(soup, selectors):
+    # The lookup the plan replaced: select_one per selector, first with text wins
+    for sel in selectors:
+        el = soup.select_one(sel)
+        if el and el.get_text(strip=True):
+            return el.get_text(strip=True)
+    return None
+
+
+def chain(soup):
+    return {name: first_hit(soup, sels) for name, sels in FIELDS.items()}
+
+
+@pytest.mark.parametrize("page", PAGES)
+def test_unlearned_plan_matches_selector_chain(page):
+    soup = soup_for(page)
+    assert SelectorPlan(FIELDS).extract(soup) == chain(soup)
+
+
+def test_empty_first_match_falls_through_to_next_selector():
+    out = SelectorPlan(FIELDS).extract(soup_for("actuarylist_empty_h1"))
+    assert out["title"] == "Head of Capital Modelling"  # the logo <h1> is empty
+    assert out["company"] == "Contoso Pensions"
+    assert out["salary"] == "$250K - $300K"
+    assert out["job_type"] is None
+
+
+def test_learning_keeps_only_selectors_that_hit():
+    plan = SelectorPlan(FIELDS, learn_pages=2)
+    for page in ("actuarylist_pricing", "actuarylist_reserving"):
+        plan.extract(soup_for(page))
+    hot = plan.stats()["hot"]
+    assert hot["title"] == ["h1"]
+    assert hot["company"] == ["[class*=company] a"]
+    assert hot["posted"] == ["[class*=posted]"]
+    assert hot["salary"] == ["[class*=salary]"]
+    assert hot["job_type"] == ["[class*=job-type]"]
+
+
+def test_learned_plan_still_matches_chain_on_known_layout():
+    plan = SelectorPlan(FIELDS, learn_pages=2)
+    for page in ("actuarylist_pricing", "actuarylist_reserving"):
+        plan.extract(soup_for(page))
+    soup = soup_for("actuarylist_pricing")
+    assert plan.extract(soup) == chain(soup)
+
+
+def test_miss_runs_full_chain_and_promotes_the_selector_that_hit():
+    plan = SelectorPlan(FIELDS, learn_pages=2)
+    for page in ("actuarylist_pricing", "actuarylist_reserving"):
+        plan.extract(soup_for(page))
+
+    # No company link, a bare <time> and no salary: the hot pass misses these
+    soup = soup_for("actuarylist_plain_company")
+    assert plan.extract(soup) == chain(soup)
+
+    hot = plan.stats()["hot"]
+    assert hot["company"] == ["[class*=company] a", "[class*=company]"]  # declared order kept
+    assert hot["posted"] == ["[class*=posted]", "time"]
+    assert hot["salary"] == ["[class*=salary]"]
+
+
+def test_learned_plan_prefers_hot_selector_over_unseen_higher_priority_one():
+    # The documented trade-off: once "[class*=company]" is hot and the
+    # higher-priority "[class*=company] a" is cold, a page with both takes
+    # the hot one's text. learn_pages=0 keeps strict priority.
+    html = '<h1>T</h1><div class="company-badge">Badge</div><div class="company-name"><a href="/c">Linked</a></div>'
+    learned = SelectorPlan(FIELDS, learn_pages=1)
+    learned.extract(soup_for("actuarylist_plain_company"))
+    assert learned.extract(BeautifulSoup(html, "html.parser"))["company"] == "Badge"
+
+    strict = SelectorPlan(FIELDS, learn_pages=0)
+    strict.extract(soup_for("actuarylist_plain_company"))
+    assert strict.extract(BeautifulSoup(html, "html.parser"))["company"] == "Linked"
+
+
+def test_actuarylist_extractor_item():
+    url = "https://www.actuarylist.com/actuarial-jobs/12345-acme-re"
+    item = ActuaryListExtractor().extract(soup_for("actuarylist_pricing"), url)
+    assert item == {
+        "title": "Senior Pricing Actuary",
+        "company": "Acme Re",
+        "location": "London, United Kingdom",
+        "description": "Lead pricing for the property catastrophe book. "
+                       "Build GLMs in Python and R, and present results to underwriting leadership.",
+        "posting_date": parse_relative_time("3 days ago").isoformat(),
+        "job_type": "Full-time",
+        "tags": ["Pricing", "P&C", "Reinsurance"],
+        "salary_text": "£85,000 - £110,000",
+        "source_url": url,
+    }
+
+
+def test_actuarylist_extractor_defaults_and_truncation():
+    url = "https://www.actuarylist.com/actuarial-jobs/777-contoso-pensions"
+    item = ActuaryListExtractor().extract(soup_for("actuarylist_empty_h1"), url, description_max_chars=20)
+    assert item["job_type"] == "Full-time"
+    assert item["location"] == "New York"
+    assert item["description"] == "Own the internal mod"
+    assert item["posting_date"] == parse_relative_time("Just posted").isoformat()
+
+
+def test_extractor_requires_extract():
+    class Incomplete(Extractor):
+        fields = {"title": ["h1"]}
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_extractor_for_matches_host_suffix_and_falls_back_to_default():
+    default = extractor_for("https://example.org/job/1")
+    assert isinstance(default, ActuaryListExtractor)
+    assert extractor_for("https://www.actuarylist.com/actuarial-jobs/1-x") is default
+
+    class Other(Extractor):
+        name = "other"
+        domains = ("jobs.example.net",)
+        fields = {"title": ["h1"]}
+
+        def extract(self, soup, url, **options):
+            return {"title": self.plan.extract(soup)["title"]}
+
+    saved = dict(extractors._registry)
+    try:
+        other = extractors.register(Other())
+        assert extractor_for("https://eu.jobs.example.net/1") is other
+        assert extractor_for("https://example.net/1") is default
+    finally:
+        extractors._registry.clear()
+        extractors._registry.update(saved)
@@ -4,24 +4,37 @@ from flask import Flask, jsonify
 from flask_cors import CORS
 
 from config import Config
-from db import init_db
+from db import pool_stats
+from gzip_request import GzipRequestMiddleware
 from routes.job_routes import job_bp
-from routes.scrape_routes import scrape_bp  # NEW
+from routes.scrape_routes import scrape_bp, warm_pool  # NEW
+from routes.admin_routes import admin_bp
 
 def create_app():
     app = Flask(__name__)
     app.config["JSON_SORT_KEYS"] = False
+    app.wsgi_app = GzipRequestMiddleware(app.wsgi_app, Config.MAX_DECOMPRESSED_REQUEST_BYTES)
 
-    init_db()
+    # Schema is managed explicitly: `python manage.py init-db`
     CORS(app, resources={r"/api/*": {"origins": Config.CORS_ORIGINS}})
 
     app.register_blueprint(job_bp, url_prefix="/api")
     app.register_blueprint(scrape_bp, url_prefix="/api")  # NEW
+    app.register_blueprint(admin_bp, url_prefix="/api")
+    if Config.SCRAPER_POOL_WARM:
+        warm_pool()
+    if Config.CRAWL_SCHEDULER_ENABLED:
+        from scheduler import start_scheduler
+        start_scheduler()
 
     @app.get("/healthz")
     def healthz():
         return {"status": "ok"}
 
+    @app.get("/healthz/pool")
+    def healthz_pool():
+        return jsonify(pool_stats())
+
     @app.errorhandler(400)
     def bad_request(e):
         return jsonify(error="Bad request"), 400
@@ -0,0 +1,488 @@
+# APP/backend/bulk_load.py
+"""Set-based job ingestion straight into the database.
+
+Same dedupe rules as POST /jobs/bulk (source_url, then lower-cased
+title/company/location + posting_date; content_hash for upserts), but
+resolved with a handful of batched queries instead of one ORM flush per
+item. On Postgres new rows are streamed with COPY into a staging table and
+merged with INSERT ... SELECT ... ON CONFLICT; other databases fall back to
+SQLAlchemy executemany.
+
+Used by ``scrape.py --save db`` and runnable on its own for backfills:
+
+    python bulk_load.py jobs.json --mode upsert
+"""
+import csv, io, json
+from datetime import date, datetime, timezone
+
+from dateutil import parser as dateparser
+from sqlalchemy import select, insert, update, delete, func, text, bindparam
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, selectinload
+
+import near_dup
+import retention
+import salary
+from config import Config
+from db import engine
+from models.job import (
+    Job, Tag, JobTag, JobDescription, JobSignature, JobLshBucket,
+    encode_description, refresh_list_rows, SUMMARY_MAX_CHARS,
+)
+
+_CHUNK = 500
+
+_JOB_COLUMNS = [
+    "id", "title", "company", "location", "summary", "posting_date", "posted_at",
+    "job_type", "salary_text", "source_url", "content_hash", "duplicate_of",
+    *salary.COLUMNS,
+]
+
+
+def _chunks(seq, size: int = _CHUNK):
+    seq = list(seq)
+    for i in range(0, len(seq), size):
+        yield seq[i:i + size]
+
+
+def _tags(payload: dict) -> list[str]:
+    tags = payload.get("tags") or []
+    if isinstance(tags, str):
+        tags = [t.strip() for t in tags.split(",") if t.strip()]
+    return list(dict.fromkeys(n for n in (Tag.normalize(t) for t in tags) if n))
+
+
+def _parse_posted_at(val):
+    if not val:
+        return None
+    try:
+        dt = dateparser.isoparse(val)
+        return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+    except Exception:
+        return None
+
+
+def _plan_item(idx: int, payload) -> dict:
+    if not isinstance(payload, dict):
+        return {"idx": idx, "error": {"item": "item must be an object"}}
+    errors = {f: f"{f} is required." for f in ("title", "company", "location") if not payload.get(f)}
+    pd = None
+    if payload.get("posting_date"):
+        try:
+            pd = dateparser.isoparse(payload["posting_date"]).date()
+        except Exception:
+            errors["posting_date"] = "posting_date must be ISO date, e.g., 2025-10-04"
+    if errors:
+        return {"idx": idx, "error": errors}
+    description = payload.get("description") or None
+    tags = _tags(payload)
+    return {
+        "idx": idx,
+        "title": payload["title"].strip(),
+        "company": payload["company"].strip(),
+        "location": payload["location"].strip(),
+        "description": description,
+        "summary": description[:SUMMARY_MAX_CHARS] if description else None,
+        "posting_date": pd,
+        "posted_at": _parse_posted_at(payload.get("posted_at")),
+        "job_type": payload.get("job_type"),
+        "salary_text": payload.get("salary_text"),
+        **salary.columns(payload.get("salary_text")),
+        "source_url": payload.get("source_url") or None,
+        "tags": tags,
+        "content_hash": Job.fingerprint(
+            payload["title"], payload["company"], payload["location"], description,
+            payload.get("job_type"), payload.get("salary_text"), tags,
+        ),
+        "sig": near_dup.signature_for(payload["title"], payload["company"], description),
+    }
+
+
+def _natural_key(title, company, location, posting_date):
+    return (title.strip().lower(), company.strip().lower(), location.strip().lower(), posting_date)
+
+
+def _match_existing(conn, rows: list[dict]) -> None:
+    """Attach ``match`` (id, source_url, content_hash) to rows already stored."""
+    by_url = {}
+    urls = {r["source_url"] for r in rows if r["source_url"]}
+    for chunk in _chunks(urls):
+        for m in conn.execute(
+            select(Job.id, Job.source_url, Job.content_hash).where(Job.source_url.in_(chunk))
+        ).mappings():
+            by_url[m["source_url"]] = dict(m)
+
+    by_key = {}
+    titles = {r["title"].lower() for r in rows if not (r["source_url"] and r["source_url"] in by_url)}
+    for chunk in _chunks(titles):
+        for m in conn.execute(
+            select(Job.id, Job.source_url, Job.content_hash, Job.title, Job.company, Job.location, Job.posting_date)
+            .where(func.lower(Job.title).in_(chunk))
+            .order_by(Job.id)
+        ).mappings():
+            key = _natural_key(m["title"], m["company"], m["location"], m["posting_date"])
+            by_key.setdefault(key, {"id": m["id"], "source_url": m["source_url"], "content_hash": m["content_hash"]})
+
+    for r in rows:
+        r["match"] = by_url.get(r["source_url"]) or by_key.get(
+            _natural_key(r["title"], r["company"], r["location"], r["posting_date"])
+        )
+
+
+def _copy_value(v):
+    if isinstance(v, (bytes, bytearray)):
+        return "\\x" + bytes(v).hex()
+    if isinstance(v, (date, datetime)):
+        return v.isoformat()
+    return v
+
+
+def _copy_rows(conn, table: str, columns: list[str], rows: list[dict]) -> None:
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for r in rows:
+        writer.writerow([_copy_value(r.get(c)) for c in columns])
+    buf.seek(0)
+    cur = conn.connection.cursor()
+    try:
+        cur.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buf)
+    finally:
+        cur.close()
+
+
+def _write_children(conn, table, rows: list[dict], use_copy: bool) -> None:
+    if not rows:
+        return
+    if use_copy:
+        _copy_rows(conn, table.name, list(rows[0].keys()), rows)
+    else:
+        for chunk in _chunks(rows):
+            conn.execute(insert(table), chunk)
+
+
+def _insert_jobs(conn, rows: list[dict], use_copy: bool) -> set[int]:
+    """Insert new job rows, assigning ``id``; returns the ids actually stored."""
+    if not rows:
+        return set()
+    if use_copy:
+        ids = conn.execute(
+            text("SELECT nextval(pg_get_serial_sequence('jobs', 'id')) FROM generate_series(1, :n)"),
+            {"n": len(rows)},
+        ).scalars().all()
+        for r, new_id in zip(rows, ids):
+            r["id"] = new_id
+        cols = ", ".join(_JOB_COLUMNS)
+        conn.execute(text("CREATE TEMP TABLE _stage_jobs (LIKE jobs INCLUDING DEFAULTS) ON COMMIT DROP"))
+        _copy_rows(conn, "_stage_jobs", _JOB_COLUMNS, rows)
+        # A concurrent writer may have taken a source_url since we matched
+        return set(conn.execute(text(
+            f"INSERT INTO jobs ({cols}) SELECT {cols} FROM _stage_jobs "
+            f"ON CONFLICT (source_url) DO NOTHING RETURNING id"
+        )).scalars())
+
+    table = Job.__table__
+    stored = set()
+    for chunk in _chunks(rows):
+        values = [{c: r[c] for c in _JOB_COLUMNS if c != "id"} for r in chunk]
+        ids = conn.execute(
+            insert(table).returning(table.c.id, sort_by_parameter_order=True), values
+        ).scalars().all()
+        for r, new_id in zip(chunk, ids):
+            r["id"] = new_id
+        stored.update(ids)
+    return stored
+
+
+def _tag_ids(conn, names: set[str], use_pg: bool) -> dict[str, int]:
+    found = {}
+    for chunk in _chunks(names):
+        found.update({n: i for i, n in conn.execute(select(Tag.id, Tag.name).where(Tag.name.in_(chunk)))})
+    missing = [{"name": n} for n in names if n not in found]
+    if missing:
+        if use_pg:
+            conn.execute(pg_insert(Tag.__table__).on_conflict_do_nothing(index_elements=["name"]), missing)
+        else:
+            conn.execute(insert(Tag.__table__), missing)
+        for chunk in _chunks([m["name"] for m in missing]):
+            found.update({n: i for i, n in conn.execute(select(Tag.id, Tag.name).where(Tag.name.in_(chunk)))})
+    return found
+
+
+def _write_dependents(conn, rows: list[dict], use_copy: bool) -> None:
+    """Descriptions, tags and near-dup index rows for freshly written jobs."""
+    desc_rows = []
+    for r in rows:
+        if r["description"]:
+            encoding, body = encode_description(r["description"])
+            desc_rows.append({"job_id": r["id"], "encoding": encoding, "body": body})
+    _write_children(conn, JobDescription.__table__, desc_rows, use_copy)
+
+    tag_ids = _tag_ids(conn, {t for r in rows for t in r["tags"]}, use_copy)
+    _write_children(conn, JobTag.__table__, [
+        {"job_id": r["id"], "tag_id": tag_ids[t]} for r in rows for t in r["tags"]
+    ], use_copy)
+
+    sig_rows, bucket_rows = [], []
+    for r in rows:
+        if r["sig"] is not None:
+            sig_row, buckets = near_dup.signature_rows(r["id"], r["sig"])
+            sig_rows.append(sig_row)
+            bucket_rows.extend(buckets)
+    _write_children(conn, JobSignature.__table__, sig_rows, use_copy)
+    _write_children(conn, JobLshBucket.__table__, bucket_rows, use_copy)
+
+
+def _rewrite_jobs(conn, rows: list[dict], use_copy: bool) -> None:
+    """Upsert path: overwrite changed jobs and rebuild their dependents."""
+    if not rows:
+        return
+    table = Job.__table__
+    fields = ["title", "company", "location", "summary", "posting_date", "posted_at",
+              "job_type", "salary_text", "content_hash", *salary.COLUMNS]
+    stmt = (
+        update(table)
+        .where(table.c.id == bindparam("b_id"))
+        .values(updated_at=func.now(), **{f: bindparam(f"b_{f}") for f in fields})
+    )
+    for r in rows:
+        r["id"] = r["match"]["id"]
+    for chunk in _chunks(rows):
+        conn.execute(stmt, [{"b_id": r["id"], **{f"b_{f}": r[f] for f in fields}} for r in chunk])
+        url_rows = [{"b_id": r["id"], "b_url": r["source_url"]} for r in chunk if r["source_url"]]
+        if url_rows:
+            conn.execute(update(table).where(table.c.id == bindparam("b_id")).values(source_url=bindparam("b_url")), url_rows)
+        ids = [r["id"] for r in chunk]
+        for child in (JobDescription, JobSignature, JobLshBucket, JobTag):
+            conn.execute(delete(child.__table__).where(child.__table__.c.job_id.in_(ids)))
+    _write_dependents(conn, rows, use_copy)
+
+
+def save_jobs(items: list, mode: str = "insert", near_duplicates: str | None = None,
+              dry_run: bool = False, listed_urls: list | None = None) -> dict:
+    """Ingest scraped items; returns the same summary/results shape as POST /jobs/bulk.
+
+    ``listed_urls`` are links still on the source's listing pages; matching
+    jobs count as seen for retention even though they were not re-scraped.
+    A job repeated within the batch is written once. Insert mode keeps the first
+    occurrence; upsert mode stores the last, as sequential API writes would.
+    """
+    near_policy = (near_duplicates or Config.NEAR_DUP_POLICY).strip().lower()
+    use_copy = engine.dialect.name == "postgresql" and engine.dialect.driver == "psycopg2"
+
+    plans = [_plan_item(i, p) for i, p in enumerate(items)]
+    results: dict[int, dict] = {}
+    counts = dict.fromkeys(["inserted", "updated", "unchanged", "skipped", "invalid", "failed"], 0)
+
+    with engine.connect() as conn:
+        rows = []
+        for p in plans:
+            if "error" in p:
+                counts["invalid"] += 1
+                results[p["idx"]] = {"index": p["idx"], "status": "invalid", "reason": p["error"]}
+            else:
+                rows.append(p)
+        _match_existing(conn, rows)
+
+        # Batch-internal duplicates: later occurrences hang off the first one
+        seen_urls, seen_keys, seen_matches, firsts, fresh, changed = {}, {}, {}, [], [], []
+        for r in rows:
+            key = _natural_key(r["title"], r["company"], r["location"], r["posting_date"])
+            m = r["match"]
+            if m is not None:
+                first = seen_matches.get(m["id"])
+            else:
+                first = (seen_urls.get(r["source_url"]) if r["source_url"] else None) or seen_keys.get(key)
+            if first is not None:
+                first["later"].append(r)
+                continue
+            r["later"] = []
+            if r["source_url"]:
+                seen_urls.setdefault(r["source_url"], r)
+            seen_keys.setdefault(key, r)
+            if m is not None:
+                seen_matches[m["id"]] = r
+            firsts.append(r)
+
+        for r in firsts:
+            m = r["match"]
+            if mode == "upsert" and r["later"]:
+                _take_content(r, r["later"][-1])
+            if m is not None and mode == "insert":
+                counts["skipped"] += 1
+                results[r["idx"]] = {"index": r["idx"], "status": "skipped-duplicate", "existing_id": m["id"], "existing_source_url": m["source_url"]}
+            elif m is not None and m["content_hash"] == r["content_hash"]:
+                counts["unchanged"] += 1
+                results[r["idx"]] = {"index": r["idx"], "status": "unchanged", "id": m["id"]}
+            elif m is not None:
+                changed.append(r)
+            else:
+                fresh.append(r)
+
+        # Near-duplicates: against stored jobs in one pass, then within the batch
+        similar = {}
+        if near_policy != "off":
+            similar = near_dup.find_similar_many(conn, {r["idx"]: r["sig"] for r in fresh})
+        batch_buckets: dict = {}
+        to_insert = []
+        for r in fresh:
+            r["duplicate_of"] = None
+            near = None
+            if r["idx"] in similar:
+                job_id, score = similar[r["idx"]]
+                near = {"id": job_id, "similarity": round(score, 3)}
+            elif near_policy != "off" and r["sig"] is not None:
+                peers = {id(o): o for bk in near_dup.band_keys(r["sig"]) for o in batch_buckets.get(bk, [])}
+                scored = [(o, near_dup.similarity(r["sig"], o["sig"])) for o in peers.values()]
+                scored = [p for p in scored if p[1] >= Config.NEAR_DUP_THRESHOLD]
+                if scored:
+                    other, score = max(scored, key=lambda p: p[1])
+                    r["near_batch"] = other.get("near_batch") or other
+                    near = {"index": other["idx"], "similarity": round(score, 3)}
+            if near and near_policy == "skip":
+                counts["skipped"] += 1
+                results[r["idx"]] = {"index": r["idx"], "status": "skipped-near-duplicate", **(
+                    {"existing_id": near["id"]} if "id" in near else {"existing_index": near["index"]}
+                ), "similarity": near["similarity"]}
+                continue
+            if near and "id" in near:
+                r["duplicate_of"] = near_dup.canonical_id(conn, near["id"])
+            r["near"] = near
+            if r["sig"] is not None:
+                for bk in near_dup.band_keys(r["sig"]):
+                    batch_buckets.setdefault(bk, []).append(r)
+            to_insert.append(r)
+
+        if dry_run:
+            for r in changed:
+                counts["updated"] += 1
+                results[r["idx"]] = {"index": r["idx"], "status": "would-update", "id": r["match"]["id"]}
+            for r in to_insert:
+                counts["inserted"] += 1
+                results[r["idx"]] = {"index": r["idx"], "status": "would-insert", **({"near_duplicate_of": r["near"]} if r["near"] else {})}
+            _report_later(firsts, results, counts, mode, dry_run=True)
+            conn.rollback()
+            return {"summary": counts, "results": [results[i] for i in sorted(results)]}
+
+        try:
+            stored_ids = _insert_jobs(conn, to_insert, use_copy)
+            written = [r for r in to_insert if r["id"] in stored_ids]
+            _write_dependents(conn, written, use_copy)
+
+            # Batch-internal near-dups point at the (now inserted) earlier row
+            links = [
+                {"b_id": r["id"], "b_dup": r["near_batch"]["duplicate_of"] or r["near_batch"]["id"]}
+                for r in written if r.get("near_batch") and r["near_batch"]["id"] in stored_ids
+            ]
+            if links:
+                conn.execute(
+                    update(Job.__table__).where(Job.__table__.c.id == bindparam("b_id")).values(duplicate_of=bindparam("b_dup")),
+                    links,
+                )
+            for r in to_insert:
+                if r["id"] in stored_ids:
+                    counts["inserted"] += 1
+                    results[r["idx"]] = {"index": r["idx"], "status": "inserted", "id": r["id"], **({"near_duplicate_of": r["near"]} if r["near"] else {})}
+                else:
+                    counts["skipped"] += 1
+                    results[r["idx"]] = {"index": r["idx"], "status": "skipped-duplicate"}
+
+            retention.mark_seen(conn, {r["match"]["id"] for r in rows if r["match"]})
+            retention.mark_listed(conn, listed_urls)
+            _rewrite_jobs(conn, changed, use_copy)
+            for r in changed:
+                counts["updated"] += 1
+                results[r["idx"]] = {"index": r["idx"], "status": "updated", "id": r["id"]}
+            refresh_list_rows(conn, stored_ids | {r["id"] for r in changed})
+            conn.commit()
+            _report_later(firsts, results, counts, mode)
+        except Exception:
+            conn.rollback()
+            raise
+
+    return {"summary": counts, "results": [results[i] for i in sorted(results)]}
+
+
+def _take_content(first: dict, last: dict) -> None:
+    # Upsert: the first occurrence is written with the last occurrence's content
+    first["own_hash"] = first["content_hash"]
+    for k, v in last.items():
+        if k not in ("idx", "match", "later"):
+            first[k] = v
+
+
+def _report_later(firsts: list, results: dict, counts: dict, mode: str, dry_run: bool = False) -> None:
+    """Results for repeated items, as sequential POST /jobs/bulk writes would report them."""
+    for first in firsts:
+        if not first["later"]:
+            continue
+        res = results[first["idx"]]
+        job_id = res.get("id") or (res.get("existing_id") if res["status"] == "skipped-duplicate" else None)
+        prev = first.get("own_hash", first["content_hash"])
+        for r in first["later"]:
+            if mode == "insert" or (job_id is None and not dry_run):
+                # Nothing stored for the first occurrence (or insert mode): a plain duplicate
+                counts["skipped"] += 1
+                results[r["idx"]] = {"index": r["idx"], "status": "skipped-duplicate", **(
+                    {"existing_id": job_id, "existing_source_url": res.get("existing_source_url", first["source_url"])}
+                    if job_id else {}
+                )}
+            elif r["content_hash"] == prev:
+                counts["unchanged"] += 1
+                results[r["idx"]] = {"index": r["idx"], "status": "unchanged", **({"id": job_id} if job_id else {})}
+            else:
+                counts["updated"] += 1
+                results[r["idx"]] = {"index": r["idx"], "status": "would-update" if dry_run else "updated",
+                                     **({"id": job_id} if job_id else {})}
+            prev = r["content_hash"]
+
+
+def backfill_content_hashes(batch_size: int = _CHUNK) -> int:
+    """Fill content_hash for rows stored before it existed, in id-ordered batches.
+
+    Without it the first upsert re-scrape would rewrite every older job.
+    updated_at is left alone: the row's content does not change.
+    """
+    table = Job.__table__
+    stmt = (
+        update(table)
+        .where(table.c.id == bindparam("b_id"))
+        .values(content_hash=bindparam("b_hash"), updated_at=table.c.updated_at)
+    )
+    filled, last_id = 0, 0
+    while True:
+        with Session(engine) as s:
+            jobs = s.execute(
+                select(Job)
+                .where(Job.id > last_id, Job.content_hash.is_(None))
+                .order_by(Job.id)
+                .limit(batch_size)
+                .options(selectinload(Job.tags), selectinload(Job.description_row))
+            ).scalars().all()
+            if not jobs:
+                break
+            params = [{"b_id": j.id, "b_hash": Job.fingerprint(
+                j.title, j.company, j.location, j.description, j.job_type, j.salary_text,
+                [t.name for t in j.tags],
+            )} for j in jobs]
+            s.connection().execute(stmt, params)
+            s.commit()
+        filled += len(params)
+        last_id = params[-1]["b_id"]
+    return filled
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Load scraped jobs (JSON array or {items: [...]}) into the database")
+    parser.add_argument("path", help="JSON file with job items")
+    parser.add_argument("--mode", choices=["insert", "upsert"], default="insert")
+    parser.add_argument("--near-duplicates", choices=["flag", "skip", "off"], default=None)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    with open(args.path, encoding="utf-8") as fh:
+        data = json.load(fh)
+    items = data.get("items", []) if isinstance(data, dict) else data
+    out = save_jobs(items, mode=args.mode, near_duplicates=args.near_duplicates, dry_run=args.dry_run)
+    print(json.dumps(out["summary"]))
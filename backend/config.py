@@ -12,9 +12,67 @@ class Config:
     if not SQLALCHEMY_DATABASE_URI:
         raise RuntimeError("DATABASE_URL is required in backend/.env")
 
+    # Optional read replica for list/detail/report reads; defaults to the primary
+    SQLALCHEMY_READ_DATABASE_URI = os.getenv("DATABASE_READ_URL", "").strip() or SQLALCHEMY_DATABASE_URI
+
+    # Connection pool (ignored for SQLite)
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "false").strip().lower() in ("1", "true", "yes")
+    DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0"))
+
     CORS_ORIGINS = _csv_env("CORS_ORIGINS", "http://localhost:5173")
 
     PAGINATION_DEFAULT_PAGE_SIZE = int(os.getenv("PAGINATION_DEFAULT_PAGE_SIZE", "10"))
     PAGINATION_MAX_PAGE_SIZE = int(os.getenv("PAGINATION_MAX_PAGE_SIZE", "50"))
 
     FLASK_ENV = os.getenv("FLASK_ENV", "production")
+
+    # Cap on a gzip request body once inflated (Content-Encoding: gzip)
+    MAX_DECOMPRESSED_REQUEST_BYTES = int(os.getenv("MAX_DECOMPRESSED_REQUEST_BYTES", str(32 * 1024 * 1024)))
+
+    # Job descriptions live in job_descriptions; "zlib" or "none"
+    DESCRIPTION_COMPRESSION = os.getenv("DESCRIPTION_COMPRESSION", "zlib").strip().lower()
+    DESCRIPTION_COMPRESS_MIN_BYTES = int(os.getenv("DESCRIPTION_COMPRESS_MIN_BYTES", "512"))
+
+    # Near-duplicate detection (MinHash/LSH): flag | skip | off
+    NEAR_DUP_POLICY = os.getenv("NEAR_DUP_POLICY", "flag").strip().lower()
+    NEAR_DUP_THRESHOLD = float(os.getenv("NEAR_DUP_THRESHOLD", "0.8"))
+
+    # Retention (0 disables a rule): postings older than MAX_AGE_DAYS by
+    # posting_date/posted_at/created_at, or scraped postings not seen for MISSING_DAYS
+    RETENTION_MAX_AGE_DAYS = int(os.getenv("RETENTION_MAX_AGE_DAYS", "180"))
+    RETENTION_MISSING_DAYS = int(os.getenv("RETENTION_MISSING_DAYS", "30"))
+    RETENTION_BATCH_SIZE = int(os.getenv("RETENTION_BATCH_SIZE", "500"))
+
+    # Required as X-Admin-Token on /api/admin/* when set
+    ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "").strip()
+
+    # Scheduled crawl: "url|minutes|limit" entries, comma-separated (minutes/limit optional)
+    CRAWL_LISTINGS = os.getenv(
+        "CRAWL_LISTINGS", "https://www.actuarylist.com/experience-levels/senior-actuary"
+    )
+    CRAWL_INTERVAL_MINUTES = float(os.getenv("CRAWL_INTERVAL_MINUTES", "360"))
+    CRAWL_LISTING_LIMIT = int(os.getenv("CRAWL_LISTING_LIMIT", "100"))
+    CRAWL_WORKERS = int(os.getenv("CRAWL_WORKERS", "2"))
+    CRAWL_TICK_SECONDS = float(os.getenv("CRAWL_TICK_SECONDS", "60"))
+    CRAWL_SAVE_MODE = os.getenv("CRAWL_SAVE_MODE", "upsert").strip().lower()
+    CRAWL_STATE_PATH = os.getenv(
+        "CRAWL_STATE_PATH",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Scraper", ".crawl_state.sqlite3"),
+    )
+    CRAWL_SCHEDULER_ENABLED = os.getenv("CRAWL_SCHEDULER_ENABLED", "false").strip().lower() in ("1", "true", "yes")
+
+    # Checkpoints of /api/scrape/start runs, for {"resume": <run id>}
+    SCRAPE_CHECKPOINT_PATH = os.getenv(
+        "SCRAPE_CHECKPOINT_PATH",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Scraper", ".scrape_runs.sqlite3"),
+    )
+
+    # Scraper: warm Chrome driver pool shared by /api/scrape/start runs.
+    # Warming imports selenium at boot, so only enable it on workers that scrape.
+    SCRAPER_POOL_SIZE = int(os.getenv("SCRAPER_POOL_SIZE", "1"))
+    SCRAPER_POOL_MAX_PAGES = int(os.getenv("SCRAPER_POOL_MAX_PAGES", "200"))
+    SCRAPER_POOL_WARM = os.getenv("SCRAPER_POOL_WARM", "false").strip().lower() in ("1", "true", "yes")
@@ -1,19 +1,50 @@
-from sqlalchemy import create_engine
+from sqlalchemy import BigInteger, Integer, create_engine, inspect, literal, text
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
 
 from config import Config
 
-# Engine
-engine = create_engine(
-    Config.SQLALCHEMY_DATABASE_URI,
-    future=True,
-    pool_pre_ping=True,
-)
+def _make_engine(url: str):
+    kwargs = {"future": True, "pool_pre_ping": Config.DB_POOL_PRE_PING}
+    if not url.startswith("sqlite"):
+        kwargs.update(
+            pool_size=Config.DB_POOL_SIZE,
+            max_overflow=Config.DB_MAX_OVERFLOW,
+            pool_timeout=Config.DB_POOL_TIMEOUT,
+            pool_recycle=Config.DB_POOL_RECYCLE,
+        )
+        if Config.DB_STATEMENT_TIMEOUT_MS > 0 and url.startswith("postgresql"):
+            kwargs["connect_args"] = {"options": f"-c statement_timeout={Config.DB_STATEMENT_TIMEOUT_MS}"}
+    return create_engine(url, **kwargs)
+
+# Engines: writes go to the primary; reads may go to a replica
+engine = _make_engine(Config.SQLALCHEMY_DATABASE_URI)
+if Config.SQLALCHEMY_READ_DATABASE_URI == Config.SQLALCHEMY_DATABASE_URI:
+    read_engine = engine
+else:
+    read_engine = _make_engine(Config.SQLALCHEMY_READ_DATABASE_URI)
 
-# Session factory
+# Session factories
 SessionLocal = sessionmaker(
     bind=engine, autoflush=False, autocommit=False, expire_on_commit=False, future=True
 )
+ReadSessionLocal = sessionmaker(
+    bind=read_engine, autoflush=False, autocommit=False, expire_on_commit=False, future=True
+)
+
+def _pool_stats(eng) -> dict:
+    pool = eng.pool
+    stats = {"url": eng.url.render_as_string(hide_password=True), "class": type(pool).__name__, "status": pool.status()}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        fn = getattr(pool, name, None)
+        if callable(fn):
+            stats[name] = fn()
+    return stats
+
+def pool_stats() -> dict:
+    return {
+        "write": _pool_stats(engine),
+        "read": _pool_stats(read_engine) if read_engine is not engine else "same-as-write",
+    }
 
 # Declarative Base
 class Base(DeclarativeBase):
@@ -22,4 +53,73 @@ class Base(DeclarativeBase):
 def init_db():
     # Import models to register tables
     from models import job  # noqa: F401
+    if engine.dialect.name == "postgresql":
+        # Trigram indexes on jobs.location / jobs.company
+        with engine.begin() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
     Base.metadata.create_all(bind=engine)
+    upgrade_schema()
+
+def upgrade_schema():
+    """Bring existing tables up to the models without a migration tool.
+
+    create_all() only creates missing tables, so nullable columns (and their
+    indexes) added to a model since a table was created are added here, and
+    Integer columns the model has since made BigInteger are widened.
+    """
+    insp = inspect(engine)
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if not insp.has_table(table.name):
+                continue
+            existing = {c["name"]: c["type"] for c in insp.get_columns(table.name)}
+            for col in table.columns:
+                if col.name in existing:
+                    _widen_integer(conn, table, col, existing[col.name])
+                    continue
+                if not col.nullable:
+                    continue
+                col_type = col.type.compile(dialect=engine.dialect)
+                ddl = f"ALTER TABLE {table.name} ADD COLUMN {col.name} {col_type}"
+                default = None
+                if col.server_default is not None:
+                    arg = col.server_default.arg
+                    default = literal(arg) if isinstance(arg, str) else arg
+                if default is not None and engine.dialect.name != "sqlite":
+                    # SQLite cannot ADD COLUMN with a non-constant default (e.g. now())
+                    compiled = default.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True})
+                    ddl += f" DEFAULT {compiled}"
+                conn.execute(text(ddl))
+                if default is not None:
+                    # Existing rows get the default a new row would (e.g. last_seen_at = now)
+                    conn.execute(table.update().values({col.name: default}))
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+        if "description" in {c["name"] for c in insp.get_columns("jobs")}:
+            _move_legacy_descriptions(conn)
+
+def _widen_integer(conn, table, col, current):
+    # SQLite integers are already 64-bit; Postgres needs ALTER ... TYPE BIGINT
+    if engine.dialect.name != "postgresql":
+        return
+    if isinstance(col.type, BigInteger) and not isinstance(current, BigInteger) and isinstance(current, Integer):
+        conn.execute(text(f"ALTER TABLE {table.name} ALTER COLUMN {col.name} TYPE BIGINT"))
+
+def _move_legacy_descriptions(conn):
+    # Pre-split schema kept descriptions inline on jobs.description.
+    from models.job import encode_description, SUMMARY_MAX_CHARS
+    rows = conn.execute(text(
+        "SELECT j.id, j.description FROM jobs j "
+        "LEFT JOIN job_descriptions d ON d.job_id = j.id "
+        "WHERE j.description IS NOT NULL AND d.job_id IS NULL"
+    )).all()
+    for job_id, desc in rows:
+        encoding, body = encode_description(desc)
+        conn.execute(
+            text("INSERT INTO job_descriptions (job_id, encoding, body) VALUES (:id, :enc, :body)"),
+            {"id": job_id, "enc": encoding, "body": body},
+        )
+        conn.execute(
+            text("UPDATE jobs SET summary = :summary, description = NULL WHERE id = :id"),
+            {"id": job_id, "summary": desc[:SUMMARY_MAX_CHARS]},
+        )
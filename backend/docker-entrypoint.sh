@@ -0,0 +1,9 @@
+#!/bin/sh
+# Schema is managed explicitly (create_app no longer creates tables): bring it
+# up to date before any worker starts. Set RUN_INIT_DB=false when a separate
+# release step runs `python manage.py init-db` (e.g. several replicas).
+set -e
+if [ "${RUN_INIT_DB:-true}" = "true" ]; then
+    python manage.py init-db
+fi
+exec "$@"
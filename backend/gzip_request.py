@@ -0,0 +1,39 @@
+# APP/backend/gzip_request.py
+"""WSGI middleware that inflates ``Content-Encoding: gzip`` request bodies.
+
+The scraper gzips its /jobs/bulk payloads; Flask never sees the encoding,
+just a plain JSON body with the right Content-Length.
+"""
+import io, json, zlib
+
+
+class GzipRequestMiddleware:
+    def __init__(self, wsgi_app, max_bytes: int):
+        self.wsgi_app = wsgi_app
+        self.max_bytes = max_bytes
+
+    def __call__(self, environ, start_response):
+        if environ.get("HTTP_CONTENT_ENCODING", "").strip().lower() != "gzip":
+            return self.wsgi_app(environ, start_response)
+
+        length = int(environ.get("CONTENT_LENGTH") or 0)
+        raw = environ["wsgi.input"].read(length) if length else environ["wsgi.input"].read()
+        inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)  # gzip header
+        try:
+            body = inflater.decompress(raw, self.max_bytes + 1)
+        except zlib.error:
+            return self._error(start_response, "400 BAD REQUEST", "Invalid gzip body")
+        if len(body) > self.max_bytes or inflater.unconsumed_tail:
+            return self._error(start_response, "413 REQUEST ENTITY TOO LARGE", "Request body too large")
+
+        environ = dict(environ)
+        environ.pop("HTTP_CONTENT_ENCODING", None)
+        environ["wsgi.input"] = io.BytesIO(body)
+        environ["CONTENT_LENGTH"] = str(len(body))
+        return self.wsgi_app(environ, start_response)
+
+    @staticmethod
+    def _error(start_response, status, message):
+        payload = json.dumps({"error": message}).encode("utf-8")
+        start_response(status, [("Content-Type", "application/json"), ("Content-Length", str(len(payload)))])
+        return [payload]
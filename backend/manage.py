@@ -0,0 +1,171 @@
+# APP/backend/manage.py
+"""Operational commands for the API.
+
+    python manage.py init-db                 # create tables / add new columns / fill content hashes
+    python manage.py startup-time --runs 5   # cold-start timings, one JSON line
+    python manage.py purge --dry-run         # retention: count / delete stale jobs
+    python manage.py crawl [--once]          # scheduled multi-listing crawl
+    python manage.py backfill-salaries       # parse salary_text into salary_* columns
+    python manage.py refresh-list-rows       # build stored /jobs list JSON for older rows
+"""
+import argparse, json, os, statistics, subprocess, sys
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Runs in a fresh interpreter so every import is cold, like a new worker.
+_STARTUP_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import app as app_module
+t1 = time.perf_counter()
+application = app_module.create_app()
+t2 = time.perf_counter()
+resp = application.test_client().get(sys.argv[1])
+t3 = time.perf_counter()
+print(json.dumps({
+    "import_s": t1 - t0,
+    "create_app_s": t2 - t1,
+    "first_request_s": t3 - t2,
+    "total_s": t3 - t0,
+    "status": resp.status_code,
+    "modules": len(sys.modules),
+    "scraper_imported": "selenium" in sys.modules,
+}))
+"""
+
+
+def cmd_init_db(args):
+    from db import init_db
+    from bulk_load import backfill_content_hashes
+    init_db()
+    print("Schema is up to date.")
+    # Older rows need a content hash, or the first upsert rewrites all of them
+    filled = backfill_content_hashes()
+    if filled:
+        print(f"Filled content_hash for {filled} existing jobs.")
+
+
+def cmd_purge(args):
+    import retention
+    from db import SessionLocal
+    rules = {k: v for k, v in (("max_age_days", args.max_age_days), ("missing_days", args.missing_days)) if v is not None}
+    out = retention.purge(
+        SessionLocal,
+        batch_size=args.batch_size,
+        max_batches=args.max_batches,
+        pause=args.pause,
+        dry_run=args.dry_run,
+        **rules,
+    )
+    print(json.dumps(out))
+
+
+def cmd_backfill_salaries(args):
+    import salary
+    from db import SessionLocal
+    out = salary.backfill(SessionLocal, batch_size=args.batch_size, recompute=args.all, pause=args.pause)
+    print(json.dumps(out))
+
+
+def cmd_refresh_list_rows(args):
+    from sqlalchemy import select
+    from db import engine
+    from models.job import Job, refresh_list_rows
+    refreshed, last_id = 0, 0
+    while True:
+        with engine.begin() as conn:
+            q = select(Job.id).where(Job.id > last_id).order_by(Job.id).limit(args.batch_size)
+            if not args.all:
+                q = q.where(Job.list_json.is_(None))
+            ids = conn.execute(q).scalars().all()
+            if not ids:
+                break
+            refreshed += refresh_list_rows(conn, ids)
+        last_id = ids[-1]
+    print(json.dumps({"refreshed": refreshed}))
+
+
+def cmd_crawl(args):
+    from scheduler import build_scheduler, CrawlerLocked
+    try:
+        sched = build_scheduler()
+    except CrawlerLocked as e:
+        sys.exit(f"Not starting: {e}")
+    try:
+        if args.once:
+            print(json.dumps(sched.run_cycle()))
+        else:
+            sched.loop()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sched.stop()
+
+
+def cmd_startup_time(args):
+    runs = []
+    for _ in range(max(1, args.runs)):
+        out = subprocess.run(
+            [sys.executable, "-c", _STARTUP_PROBE, args.path],
+            cwd=BASE_DIR, capture_output=True, text=True, check=True,
+        )
+        runs.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    summary = {
+        key: round(statistics.median(r[key] for r in runs), 4)
+        for key in ("import_s", "create_app_s", "first_request_s", "total_s")
+    }
+    summary.update(
+        runs=len(runs),
+        path=args.path,
+        status=runs[-1]["status"],
+        modules=runs[-1]["modules"],
+        scraper_imported=runs[-1]["scraper_imported"],
+    )
+    if args.release:
+        summary["release"] = args.release
+    print(json.dumps(summary))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Job API management commands")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("init-db", help="Create tables and apply additive schema upgrades")
+    p.set_defaults(func=cmd_init_db)
+
+    p = sub.add_parser("purge", help="Delete stale postings in bounded batches")
+    p.add_argument("--dry-run", action="store_true", help="Only count what would be deleted")
+    p.add_argument("--batch-size", type=int, default=None, help="Rows per delete (default RETENTION_BATCH_SIZE)")
+    p.add_argument("--max-batches", type=int, default=None, help="Stop after N batches")
+    p.add_argument("--pause", type=float, default=0.0, help="Seconds to sleep between batches")
+    p.add_argument("--max-age-days", type=int, default=None, help="Override RETENTION_MAX_AGE_DAYS (0 = off)")
+    p.add_argument("--missing-days", type=int, default=None, help="Override RETENTION_MISSING_DAYS (0 = off)")
+    p.set_defaults(func=cmd_purge)
+
+    p = sub.add_parser("backfill-salaries", help="Parse salary_text of existing jobs into salary_* columns")
+    p.add_argument("--all", action="store_true", help="Re-parse every row, not just ones from an older parser")
+    p.add_argument("--batch-size", type=int, default=500, help="Rows per update batch")
+    p.add_argument("--pause", type=float, default=0.0, help="Seconds to sleep between batches")
+    p.set_defaults(func=cmd_backfill_salaries)
+
+    p = sub.add_parser("refresh-list-rows", help="Rebuild the stored list JSON used by GET /jobs")
+    p.add_argument("--all", action="store_true", help="Rebuild every row, not just missing ones")
+    p.add_argument("--batch-size", type=int, default=500, help="Rows per transaction")
+    p.set_defaults(func=cmd_refresh_list_rows)
+
+    p = sub.add_parser("crawl", help="Crawl CRAWL_LISTINGS on their intervals via the shared frontier")
+    p.add_argument("--once", action="store_true", help="Run (or resume) a single cycle and exit")
+    p.set_defaults(func=cmd_crawl)
+
+    p = sub.add_parser("startup-time", help="Measure cold import and time to first request")
+    p.add_argument("--runs", type=int, default=5, help="Fresh interpreters to sample (median is reported)")
+    p.add_argument("--path", default="/healthz", help="Path for the first request")
+    p.add_argument("--release", default=os.getenv("RELEASE"), help="Tag to record with the numbers")
+    p.set_defaults(func=cmd_startup_time)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
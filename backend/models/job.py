@@ -1,13 +1,32 @@
 # APP/backend/models/job.py
+import hashlib, json, zlib
 from datetime import datetime, date
 from sqlalchemy import (
     Column, Integer, String, Date, DateTime, ForeignKey,
-    func, UniqueConstraint, Text
+    func, UniqueConstraint, Text, LargeBinary, BigInteger, SmallInteger, Index, Float,
+    event, select, update, bindparam,
 )
-from sqlalchemy.orm import relationship, Mapped, mapped_column
+from sqlalchemy.orm import relationship, Mapped, mapped_column, validates, Session
 
+import salary
+from config import Config
 from db import Base
 
+SUMMARY_MAX_CHARS = 300
+
+def encode_description(value: str) -> tuple[str, bytes]:
+    raw = value.encode("utf-8")
+    if Config.DESCRIPTION_COMPRESSION == "zlib" and len(raw) >= Config.DESCRIPTION_COMPRESS_MIN_BYTES:
+        return "zlib", zlib.compress(raw, 6)
+    return "plain", raw
+
+def decode_description(encoding: str, body: bytes) -> str:
+    raw = zlib.decompress(body) if encoding == "zlib" else body
+    return raw.decode("utf-8")
+
+def _collapse(value) -> str:
+    return " ".join(str(value or "").split())
+
 class JobTag(Base):
     __tablename__ = "job_tags"
     job_id: Mapped[int] = mapped_column(
@@ -26,16 +45,44 @@ class Job(Base):
     company: Mapped[str] = mapped_column(String(300), nullable=False)
     location: Mapped[str] = mapped_column(String(300), nullable=False)
 
-    # NEW: long description (optional)
-    description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Short preview for list views; the full text lives in job_descriptions
+    summary: Mapped[str | None] = mapped_column(String(SUMMARY_MAX_CHARS), nullable=True)
 
     posting_date: Mapped[date | None] = mapped_column(Date, nullable=True)
     posted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     job_type: Mapped[str | None] = mapped_column(String(50), nullable=True)
     salary_text: Mapped[str | None] = mapped_column(String(200), nullable=True)
 
+    # Parsed from salary_text on assignment (salary.py); annual values drive filters/sort
+    salary_currency: Mapped[str | None] = mapped_column(String(3), nullable=True)
+    salary_min: Mapped[float | None] = mapped_column(Float, nullable=True)
+    salary_max: Mapped[float | None] = mapped_column(Float, nullable=True)
+    salary_period: Mapped[str | None] = mapped_column(String(10), nullable=True)
+    # BigInteger: KRW/JPY (and misparsed hourly) annual amounts overflow a 32-bit int
+    salary_annual_min: Mapped[int | None] = mapped_column(BigInteger, nullable=True, index=True)
+    salary_annual_max: Mapped[int | None] = mapped_column(BigInteger, nullable=True, index=True)
+    salary_parse_version: Mapped[int | None] = mapped_column(SmallInteger, nullable=True)
+
     source_url: Mapped[str | None] = mapped_column(String(1000), nullable=True, unique=True)
 
+    # sha256 of the normalized scraped fields; see Job.fingerprint
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True, index=True)
+
+    # Set when near_dup finds an older posting this one likely repeats
+    duplicate_of: Mapped[int | None] = mapped_column(
+        ForeignKey("jobs.id", ondelete="SET NULL"), nullable=True, index=True
+    )
+
+    # Last time a scrape reported this posting; drives "gone from source" retention
+    last_seen_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=True
+    )
+
+    # Denormalized list view: the /jobs item JSON, with the sorted tag names
+    # as its "tags", rebuilt from the stored row on every write
+    # (refresh_list_rows). Tag filters query job_tags, not this.
+    list_json: Mapped[str | None] = mapped_column(Text, nullable=True)
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -43,6 +90,19 @@ class Job(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
     )
 
+    # Trigram GIN indexes serve the substring (ILIKE) location/company filters
+    # and /locations/suggest on Postgres; other databases scan.
+    __table_args__ = (
+        Index(
+            "ix_jobs_location_trgm", "location",
+            postgresql_using="gin", postgresql_ops={"location": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_jobs_company_trgm", "company",
+            postgresql_using="gin", postgresql_ops={"company": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
     tags: Mapped[list["Tag"]] = relationship(
         "Tag",
         secondary="job_tags",
@@ -51,22 +111,97 @@ class Job(Base):
         cascade="save-update",
     )
 
-    def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "title": self.title,
-            "company": self.company,
-            "location": self.location,
-            "description": self.description,  # NEW
-            "posting_date": self.posting_date.isoformat() if self.posting_date else None,
-            "posted_at": self.posted_at.isoformat() if self.posted_at else None,
-            "job_type": self.job_type,
-            "salary_text": self.salary_text,
-            "source_url": self.source_url,
-            "tags": [t.name for t in self.tags],
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
+    # Loaded only when .description is read (detail view, explicit include)
+    description_row: Mapped["JobDescription | None"] = relationship(
+        "JobDescription",
+        uselist=False,
+        lazy="select",
+        cascade="all, delete-orphan",
+    )
+
+    @property
+    def description(self) -> str | None:
+        row = self.description_row
+        return row.text if row else None
+
+    @description.setter
+    def description(self, value: str | None) -> None:
+        value = value or None
+        self.summary = value[:SUMMARY_MAX_CHARS] if value else None
+        if value is None:
+            self.description_row = None
+        elif self.description_row is not None:
+            self.description_row.text = value
+        else:
+            self.description_row = JobDescription(text=value)
+
+    @validates("salary_text")
+    def _parse_salary(self, key, value):
+        for column, parsed in salary.columns(value).items():
+            setattr(self, column, parsed)
+        return value
+
+    @staticmethod
+    def fingerprint(title, company, location, description=None, job_type=None,
+                    salary_text=None, tags=()) -> str:
+        # posting_date is left out on purpose: it is derived from "N days ago"
+        # text and shifts between runs without the posting changing.
+        parts = [
+            _collapse(title).lower(),
+            _collapse(company).lower(),
+            _collapse(location).lower(),
+            _collapse(description),
+            _collapse(job_type).lower(),
+            _collapse(salary_text),
+            sorted({Tag.normalize(t) for t in tags if Tag.normalize(t)}),
+        ]
+        return hashlib.sha256(json.dumps(parts, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+    def refresh_content_hash(self) -> None:
+        self.content_hash = Job.fingerprint(
+            self.title, self.company, self.location, self.description,
+            self.job_type, self.salary_text, [t.name for t in self.tags],
+        )
+
+    def to_dict(self, include_description: bool = True) -> dict:
+        data = list_row(self, sorted(t.name for t in self.tags))
+        if include_description:
+            data["description"] = self.description
+        return data
+
+class JobDescription(Base):
+    __tablename__ = "job_descriptions"
+    job_id: Mapped[int] = mapped_column(
+        ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True
+    )
+    encoding: Mapped[str] = mapped_column(String(10), nullable=False, default="plain")
+    body: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+    @property
+    def text(self) -> str:
+        return decode_description(self.encoding, self.body)
+
+    @text.setter
+    def text(self, value: str) -> None:
+        self.encoding, self.body = encode_description(value)
+
+class JobSignature(Base):
+    """MinHash signature of a job, used to verify LSH candidates."""
+    __tablename__ = "job_signatures"
+    job_id: Mapped[int] = mapped_column(
+        ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True
+    )
+    signature: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+class JobLshBucket(Base):
+    """One row per (job, band); jobs sharing a bucket are near-dup candidates."""
+    __tablename__ = "job_lsh_buckets"
+    job_id: Mapped[int] = mapped_column(
+        ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True
+    )
+    band: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    bucket: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    __table_args__ = (Index("ix_job_lsh_band_bucket", "band", "bucket"),)
 
 class Tag(Base):
     __tablename__ = "tags"
@@ -85,3 +220,91 @@ class Tag(Base):
     @staticmethod
     def normalize(name: str) -> str:
         return (name or "").strip().lower()
+
+# ---- list-view projection ----
+def _iso(value):
+    return value.isoformat() if value else None
+
+def list_row(job, tag_names: list[str]) -> dict:
+    """The /jobs list item for a Job or a row of its columns."""
+    return {
+        "id": job.id,
+        "title": job.title,
+        "company": job.company,
+        "location": job.location,
+        "summary": job.summary,
+        "posting_date": _iso(job.posting_date),
+        "posted_at": _iso(job.posted_at),
+        "job_type": job.job_type,
+        "salary_text": job.salary_text,
+        "salary_currency": job.salary_currency,
+        "salary_min": job.salary_min,
+        "salary_max": job.salary_max,
+        "salary_period": job.salary_period,
+        "salary_annual_min": job.salary_annual_min,
+        "salary_annual_max": job.salary_annual_max,
+        "source_url": job.source_url,
+        "duplicate_of": job.duplicate_of,
+        "tags": tag_names,
+        "created_at": _iso(job.created_at),
+        "updated_at": _iso(job.updated_at),
+    }
+
+def encode_list_row(data: dict) -> str:
+    # Same encoding as the API's jsonify (sorted keys, compact)
+    return json.dumps(data, sort_keys=True, separators=(",", ":"))
+
+_LIST_COLUMNS = [
+    "id", "title", "company", "location", "summary", "posting_date", "posted_at", "job_type",
+    "salary_text", "salary_currency", "salary_min", "salary_max", "salary_period",
+    "salary_annual_min", "salary_annual_max", "source_url", "duplicate_of", "created_at", "updated_at",
+]
+
+def refresh_list_rows(conn, ids, chunk: int = 500) -> int:
+    """Rebuild list_json for ``ids`` from what is stored now.
+
+    Call inside the writing transaction, after the job rows and tags are
+    written; ids that no longer exist are ignored.
+    """
+    ids = sorted({i for i in ids if i is not None})
+    table = Job.__table__
+    stmt = (
+        update(table)
+        .where(table.c.id == bindparam("b_id"))
+        # Pin updated_at so refreshing does not itself bump the timestamp
+        .values(list_json=bindparam("b_list_json"), updated_at=table.c.updated_at)
+    )
+    done = 0
+    for i in range(0, len(ids), chunk):
+        part = ids[i:i + chunk]
+        names: dict[int, list[str]] = {}
+        for job_id, name in conn.execute(
+            select(JobTag.job_id, Tag.name).join(Tag, Tag.id == JobTag.tag_id).where(JobTag.job_id.in_(part))
+        ):
+            names.setdefault(job_id, []).append(name)
+        params = []
+        for row in conn.execute(select(*[table.c[c] for c in _LIST_COLUMNS]).where(table.c.id.in_(part))):
+            tags = sorted(names.get(row.id, []))
+            params.append({"b_id": row.id, "b_list_json": encode_list_row(list_row(row, tags))})
+        if params:
+            conn.execute(stmt, params)
+            done += len(params)
+    return done
+
+def mark_list_rows_stale(session, ids) -> None:
+    """Queue jobs changed outside the ORM unit of work for refresh at commit."""
+    session.info.setdefault("stale_list_rows", set()).update(ids)
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_jobs(session, flush_context):
+    mark_list_rows_stale(session, [
+        obj.id for obj in list(session.new) + list(session.dirty)
+        if isinstance(obj, Job) and session.is_modified(obj)
+    ])
+
+@event.listens_for(Session, "before_commit")
+def _refresh_changed_jobs(session):
+    session.flush()
+    ids = session.info.pop("stale_list_rows", None)
+    if ids:
+        refresh_list_rows(session.connection(), ids)
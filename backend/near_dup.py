@@ -0,0 +1,186 @@
+# APP/backend/near_dup.py
+"""MinHash/LSH index for spotting the same posting under different URLs.
+
+Each job gets a MinHash signature over word 3-gram shingles of its title,
+company and description. The signature is split into bands; jobs sharing
+any band bucket are candidates, and candidates are confirmed by comparing
+signatures. Lookups hit the (band, bucket) index, so cost does not grow
+with the table.
+"""
+import random, re, struct, zlib
+
+from sqlalchemy import select, delete, insert, and_, or_
+from sqlalchemy.orm import selectinload
+
+from config import Config
+from models.job import Job, JobSignature, JobLshBucket
+
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 3
+
+_PRIME = (1 << 61) - 1
+_MASK32 = 0xFFFFFFFF
+_rng = random.Random(0x5EED)
+_PERMS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_SIG_FMT = f"<{NUM_PERM}I"
+
+
+def shingles(title: str | None, company: str | None, description: str | None = None) -> set[int]:
+    words = _WORD_RE.findall(f"{title or ''} {company or ''} {description or ''}".lower())
+    if not words:
+        return set()
+    if len(words) < SHINGLE_SIZE:
+        grams = {" ".join(words)}
+    else:
+        grams = {" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)}
+    return {zlib.crc32(g.encode("utf-8")) for g in grams}
+
+
+def minhash(shingle_set: set[int]) -> tuple[int, ...] | None:
+    if not shingle_set:
+        return None
+    return tuple(
+        min((a * x + b) % _PRIME for x in shingle_set) & _MASK32
+        for a, b in _PERMS
+    )
+
+
+def signature_for(title, company, description=None) -> tuple[int, ...] | None:
+    return minhash(shingles(title, company, description))
+
+
+def similarity(sig_a, sig_b) -> float:
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / NUM_PERM
+
+
+def band_keys(sig) -> list[tuple[int, int]]:
+    return [
+        (band, zlib.crc32(struct.pack(f"<{ROWS}I", *sig[band * ROWS:(band + 1) * ROWS])))
+        for band in range(BANDS)
+    ]
+
+
+def find_similar(session, sig, exclude_id: int | None = None,
+                 threshold: float | None = None) -> list[tuple[int, float]]:
+    """Return ``(job_id, similarity)`` pairs above threshold, best first."""
+    if sig is None:
+        return []
+    threshold = Config.NEAR_DUP_THRESHOLD if threshold is None else threshold
+    cond = or_(*[and_(JobLshBucket.band == b, JobLshBucket.bucket == h) for b, h in band_keys(sig)])
+    ids = set(session.execute(select(JobLshBucket.job_id).where(cond)).scalars())
+    ids.discard(exclude_id)
+    if not ids:
+        return []
+    rows = session.execute(
+        select(JobSignature.job_id, JobSignature.signature).where(JobSignature.job_id.in_(ids))
+    ).all()
+    scored = [(job_id, similarity(sig, struct.unpack(_SIG_FMT, raw))) for job_id, raw in rows]
+    return sorted([p for p in scored if p[1] >= threshold], key=lambda p: -p[1])
+
+
+def find_similar_many(session, sigs: dict, threshold: float | None = None) -> dict:
+    """Batch form of find_similar: ``{key: (job_id, similarity)}`` for the best match."""
+    threshold = Config.NEAR_DUP_THRESHOLD if threshold is None else threshold
+    keys_by_bucket: dict[tuple[int, int], list] = {}
+    for key, sig in sigs.items():
+        if sig is not None:
+            for bk in band_keys(sig):
+                keys_by_bucket.setdefault(bk, []).append(key)
+    candidates: dict = {}
+    pairs = list(keys_by_bucket)
+    for i in range(0, len(pairs), 200):
+        chunk = pairs[i:i + 200]
+        cond = or_(*[and_(JobLshBucket.band == b, JobLshBucket.bucket == h) for b, h in chunk])
+        rows = session.execute(
+            select(JobLshBucket.job_id, JobLshBucket.band, JobLshBucket.bucket).where(cond)
+        ).all()
+        for job_id, band, bucket in rows:
+            for key in keys_by_bucket[(band, bucket)]:
+                candidates.setdefault(key, set()).add(job_id)
+    ids = sorted(set().union(*candidates.values())) if candidates else []
+    stored: dict[int, tuple[int, ...]] = {}
+    for i in range(0, len(ids), 500):
+        rows = session.execute(
+            select(JobSignature.job_id, JobSignature.signature).where(JobSignature.job_id.in_(ids[i:i + 500]))
+        ).all()
+        stored.update({job_id: struct.unpack(_SIG_FMT, raw) for job_id, raw in rows if raw})
+    best = {}
+    for key, job_ids in candidates.items():
+        scored = [(j, similarity(sigs[key], stored[j])) for j in job_ids if j in stored]
+        scored = [p for p in scored if p[1] >= threshold]
+        if scored:
+            best[key] = max(scored, key=lambda p: (p[1], -p[0]))
+    return best
+
+
+def signature_rows(job_id: int, sig) -> tuple[dict, list[dict]]:
+    """Rows for job_signatures and job_lsh_buckets, for bulk writers."""
+    return (
+        {"job_id": job_id, "signature": struct.pack(_SIG_FMT, *sig)},
+        [{"job_id": job_id, "band": b, "bucket": h} for b, h in band_keys(sig)],
+    )
+
+
+def canonical_id(session, job_id: int) -> int:
+    # Follow duplicate_of so clusters hang off one root
+    seen = set()
+    while job_id not in seen:
+        seen.add(job_id)
+        parent = session.execute(select(Job.duplicate_of).where(Job.id == job_id)).scalar()
+        if not parent:
+            break
+        job_id = parent
+    return job_id
+
+
+def forget(session, job_id: int) -> None:
+    session.execute(delete(JobLshBucket).where(JobLshBucket.job_id == job_id))
+    session.execute(delete(JobSignature).where(JobSignature.job_id == job_id))
+
+
+def index_job(session, job_id: int, sig) -> None:
+    forget(session, job_id)
+    if sig is None:
+        return
+    sig_row, bucket_rows = signature_rows(job_id, sig)
+    session.execute(insert(JobSignature), [sig_row])
+    session.execute(insert(JobLshBucket), bucket_rows)
+
+
+def reindex_missing(session, batch_size: int = 500) -> int:
+    """Index jobs that have no signature yet (rows created before near_dup)."""
+    done = 0
+    while True:
+        jobs = session.execute(
+            select(Job)
+            .where(~select(JobSignature.job_id).where(JobSignature.job_id == Job.id).exists())
+            .options(selectinload(Job.description_row))
+            .order_by(Job.id)
+            .limit(batch_size)
+        ).scalars().all()
+        if not jobs:
+            return done
+        for job in jobs:
+            sig = signature_for(job.title, job.company, job.description)
+            # Signature-less jobs get an empty marker so the loop terminates
+            if sig is None:
+                session.execute(insert(JobSignature), [{"job_id": job.id, "signature": b""}])
+            else:
+                index_job(session, job.id, sig)
+        session.commit()
+        done += len(jobs)
+
+
+if __name__ == "__main__":
+    import argparse
+    from db import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Maintain the near-duplicate index")
+    parser.add_argument("--reindex", action="store_true", help="Index jobs that have no signature yet")
+    args = parser.parse_args()
+    if args.reindex:
+        with SessionLocal() as session:
+            print(f"Indexed {reindex_missing(session)} jobs")
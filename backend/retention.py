@@ -0,0 +1,130 @@
+# APP/backend/retention.py
+"""Retention policy and batched purge of stale postings.
+
+A job is stale when its effective date (posting_date, else posted_at, else
+created_at) is older than RETENTION_MAX_AGE_DAYS, or when it came from a
+scrape (has a source_url) and no scrape has reported it for
+RETENTION_MISSING_DAYS. Purging deletes in bounded batches, one short
+transaction each, then removes tags no job uses any more.
+"""
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select, delete, update, func, or_, and_, exists
+
+from config import Config
+from models.job import Job, Tag, JobTag, JobDescription, JobSignature, JobLshBucket, mark_list_rows_stale
+
+# At most one last_seen_at write per job per interval, so re-scrapes of
+# unchanged postings stay (nearly) write-free.
+SEEN_TOUCH_INTERVAL = timedelta(hours=12)
+
+
+def _now():
+    return datetime.now(timezone.utc)
+
+
+def _touch(session, where) -> None:
+    now = _now()
+    session.execute(
+        update(Job)
+        .where(where, or_(Job.last_seen_at.is_(None), Job.last_seen_at < now - SEEN_TOUCH_INTERVAL))
+        # Being seen again is not an edit: keep updated_at (and the stored list row) as is
+        .values(last_seen_at=now, updated_at=Job.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def mark_seen(session, job_ids) -> None:
+    ids = list(job_ids)
+    for i in range(0, len(ids), 500):
+        _touch(session, Job.id.in_(ids[i:i + 500]))
+
+
+def mark_listed(session, urls) -> None:
+    """Mark jobs seen by source_url: links a scrape found on a listing page
+    without loading them (past its limit, or failed)."""
+    urls = list({u for u in urls or () if isinstance(u, str) and u})
+    for i in range(0, len(urls), 500):
+        _touch(session, Job.source_url.in_(urls[i:i + 500]))
+
+
+def stale_conditions(max_age_days: int | None = None, missing_days: int | None = None) -> dict:
+    """Named WHERE clauses for each enabled rule."""
+    max_age_days = Config.RETENTION_MAX_AGE_DAYS if max_age_days is None else max_age_days
+    missing_days = Config.RETENTION_MISSING_DAYS if missing_days is None else missing_days
+    now = _now()
+    conds = {}
+    if max_age_days > 0:
+        # coalesce(posting_date, posted_at, created_at) < cutoff, spelled out so
+        # each branch can use its column's index (and SQLite compares correctly)
+        cutoff = now - timedelta(days=max_age_days)
+        conds["expired"] = or_(
+            Job.posting_date < cutoff.date(),
+            and_(Job.posting_date.is_(None), Job.posted_at < cutoff),
+            and_(Job.posting_date.is_(None), Job.posted_at.is_(None), Job.created_at < cutoff),
+        )
+    if missing_days > 0:
+        last_seen = func.coalesce(Job.last_seen_at, Job.created_at)
+        conds["missing"] = and_(Job.source_url.is_not(None), last_seen < now - timedelta(days=missing_days))
+    return conds
+
+
+def _orphan_tags():
+    return ~exists(select(JobTag.job_id).where(JobTag.tag_id == Tag.id))
+
+
+def count_stale(session, **rules) -> dict:
+    conds = stale_conditions(**rules)
+    counts = {name: session.execute(select(func.count()).select_from(Job).where(c)).scalar_one()
+              for name, c in conds.items()}
+    counts["total"] = session.execute(
+        select(func.count()).select_from(Job).where(or_(*conds.values()))
+    ).scalar_one() if conds else 0
+    counts["orphan_tags"] = session.execute(
+        select(func.count()).select_from(Tag).where(_orphan_tags())
+    ).scalar_one()
+    return counts
+
+
+def purge(session_factory, batch_size: int | None = None, max_batches: int | None = None,
+          pause: float = 0.0, dry_run: bool = False, **rules) -> dict:
+    """Delete stale jobs in chunks of ``batch_size``; returns counts."""
+    batch_size = max(1, batch_size or Config.RETENTION_BATCH_SIZE)
+    if dry_run:
+        with session_factory() as s:
+            return {"dry_run": True, "would_delete": count_stale(s, **rules)}
+
+    conds = stale_conditions(**rules)
+    deleted_jobs = deleted_tags = batches = 0
+    while conds and (max_batches is None or batches < max_batches):
+        with session_factory() as s:
+            ids = s.execute(
+                select(Job.id).where(or_(*conds.values())).order_by(Job.id).limit(batch_size)
+            ).scalars().all()
+            if not ids:
+                break
+            for child in (JobDescription, JobSignature, JobLshBucket, JobTag):
+                s.execute(delete(child).where(child.job_id.in_(ids)))
+            unlinked = s.execute(
+                update(Job).where(Job.duplicate_of.in_(ids)).values(duplicate_of=None)
+                .returning(Job.id).execution_options(synchronize_session=False)
+            ).scalars().all()
+            mark_list_rows_stale(s, set(unlinked) - set(ids))
+            s.execute(delete(Job).where(Job.id.in_(ids)).execution_options(synchronize_session=False))
+            s.commit()
+        deleted_jobs += len(ids)
+        batches += 1
+        if pause:
+            time.sleep(pause)
+
+    while True:
+        with session_factory() as s:
+            tag_ids = s.execute(select(Tag.id).where(_orphan_tags()).limit(batch_size)).scalars().all()
+            if not tag_ids:
+                break
+            s.execute(delete(Tag).where(Tag.id.in_(tag_ids)).execution_options(synchronize_session=False))
+            s.commit()
+        deleted_tags += len(tag_ids)
+
+    return {"dry_run": False, "deleted_jobs": deleted_jobs, "deleted_tags": deleted_tags, "batches": batches}
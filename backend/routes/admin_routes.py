@@ -0,0 +1,82 @@
+import hmac
+
+from flask import Blueprint, jsonify, request
+
+from config import Config
+from db import SessionLocal
+import retention
+
+admin_bp = Blueprint("admin_bp", __name__)
+
+
+@admin_bp.before_request
+def _require_admin_token():
+    # Fail closed: without a configured token the admin API is disabled
+    if not Config.ADMIN_TOKEN:
+        return jsonify({"error": "Admin API is disabled (ADMIN_TOKEN is not set)"}), 403
+    given = request.headers.get("X-Admin-Token") or ""
+    if not hmac.compare_digest(given.encode("utf-8"), Config.ADMIN_TOKEN.encode("utf-8")):
+        return jsonify({"error": "Forbidden"}), 403
+
+
+def _int_arg(source, key: str, minimum: int) -> int | None:
+    value = source.get(key)
+    if value is None:
+        return None
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{key} must be an integer") from None
+    if value < minimum:
+        raise ValueError(f"{key} must be >= {minimum}")
+    return value
+
+
+def _rule_overrides(source) -> dict:
+    # 0 turns a rule off, as in the RETENTION_* settings
+    rules = {}
+    for key in ("max_age_days", "missing_days"):
+        value = _int_arg(source, key, 0)
+        if value is not None:
+            rules[key] = value
+    return rules
+
+
+@admin_bp.get("/admin/retention")
+def retention_preview():
+    try:
+        rules = _rule_overrides(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    with SessionLocal() as s:
+        return jsonify({
+            "policy": {
+                "max_age_days": Config.RETENTION_MAX_AGE_DAYS,
+                "missing_days": Config.RETENTION_MISSING_DAYS,
+                "batch_size": Config.RETENTION_BATCH_SIZE,
+            },
+            "would_delete": retention.count_stale(s, **rules),
+        })
+
+
+@admin_bp.post("/admin/purge")
+def purge_stale():
+    body = request.get_json(silent=True)
+    if body is None and not request.get_data():
+        body = {}  # bare POST: configured policy
+    if not isinstance(body, dict):
+        return jsonify({"error": "Body must be a JSON object"}), 400
+    try:
+        rules = _rule_overrides(body)
+        batch_size = _int_arg(body, "batch_size", 1)
+        max_batches = _int_arg(body, "max_batches", 1)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    out = retention.purge(
+        SessionLocal,
+        batch_size=batch_size,
+        max_batches=max_batches,
+        dry_run=bool(body.get("dry_run", False)),
+        **rules,
+    )
+    return jsonify(out)
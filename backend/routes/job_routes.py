@@ -1,17 +1,21 @@
 from contextlib import contextmanager
 from dateutil import parser as dateparser
-from flask import Blueprint, request, jsonify
-from sqlalchemy import select, func, exists, cast, Date  # ← added cast, Date
-from sqlalchemy.exc import IntegrityError
+from flask import Blueprint, current_app, request, jsonify
+from sqlalchemy import select, func, exists, cast, Date, update, case
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.orm import selectinload
 
-from db import SessionLocal
-from models.job import Job, Tag, JobTag
+import near_dup
+import retention
+from config import Config
+from db import SessionLocal, ReadSessionLocal
+from models.job import Job, Tag, JobTag, encode_list_row, mark_list_rows_stale
 
 job_bp = Blueprint("job_bp", __name__)
 
 @contextmanager
-def session_scope():
-    session = SessionLocal()
+def session_scope(read_only: bool = False):
+    session = (ReadSessionLocal if read_only else SessionLocal)()
     try:
         yield session
         session.commit()
@@ -49,6 +53,29 @@ def _ensure_tags(session, tag_names: list[str]) -> list[Tag]:
     session.flush()
     return list(existing_map.values()) + created
 
+def _db_error_reason(e: Exception) -> str:
+    return "constraint" if isinstance(e, IntegrityError) else "bad-value"
+
+def _payload_tags(payload: dict) -> list[str]:
+    tags = payload.get("tags") or []
+    if isinstance(tags, str):
+        tags = [t.strip() for t in tags.split(",") if t.strip()]
+    return tags
+
+def _payload_fingerprint(payload: dict) -> str:
+    return Job.fingerprint(
+        payload.get("title"), payload.get("company"), payload.get("location"),
+        payload.get("description"), payload.get("job_type"), payload.get("salary_text"),
+        _payload_tags(payload),
+    )
+
+def _near_dup_of(s, sig, exclude_id: int | None = None) -> dict | None:
+    similar = near_dup.find_similar(s, sig, exclude_id=exclude_id)
+    if not similar:
+        return None
+    job_id, score = similar[0]
+    return {"id": job_id, "similarity": round(score, 3)}
+
 def _validate_job_payload(payload: dict, is_update: bool = False):
     errors = {}
     def req(field):
@@ -77,26 +104,43 @@ def _parse_posted_at(val: str | None):
     except Exception:
         return None
 
+def _like_escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+def _contains(column, value: str):
+    # ILIKE '%x%': served by the trigram GIN indexes on Postgres
+    return column.ilike(f"%{_like_escape(value.strip())}%", escape="\\")
+
 def _apply_filters_sort(query, args):
     q = args.get("q", type=str)
     location = args.get("location", type=str)
+    company = args.get("company", type=str)
     job_type = args.get("job_type", type=str)
+    salary_min = args.get("salary_min", type=int)
+    salary_max = args.get("salary_max", type=int)
+    salary_currency = args.get("salary_currency", type=str)
     tags = _parse_tags_arg(args.getlist("tag"))
 
     if q:
-        like = f"%{q.lower()}%"
-        query = query.where(
-            func.lower(Job.title).like(like) | func.lower(Job.company).like(like)
-        )
+        query = query.where(_contains(Job.title, q) | _contains(Job.company, q))
 
     # contains (case-insensitive)
-    if location:
-        like = f"%{location.strip().lower()}%"
-        query = query.where(func.lower(Job.location).like(like))
+    if location and location.strip():
+        query = query.where(_contains(Job.location, location))
+    if company and company.strip():
+        query = query.where(_contains(Job.company, company))
 
     if job_type:
         query = query.where(func.lower(Job.job_type) == job_type.strip().lower())
 
+    # Annual salary range must overlap [salary_min, salary_max]
+    if salary_min is not None:
+        query = query.where(Job.salary_annual_max >= salary_min)
+    if salary_max is not None:
+        query = query.where(Job.salary_annual_min <= salary_max)
+    if salary_currency and salary_currency.strip():
+        query = query.where(Job.salary_currency == salary_currency.strip().upper())
+
     for t in tags:
         tag_exists = exists(
             select(JobTag.job_id)
@@ -119,6 +163,7 @@ def _apply_filters_sort(query, args):
         "posting_date_asc":  (Job.posting_date.asc().nullsfirst(), Job.created_at.asc()),
         "title_asc":         (Job.title.asc(), Job.created_at.desc()),
         "title_desc":        (Job.title.desc(), Job.created_at.desc()),
+        "salary_desc":       (Job.salary_annual_max.desc().nullslast(), Job.created_at.desc()),
     }
     ord_spec = order_map.get(sort, (Job.posting_date.desc().nullslast(), Job.created_at.desc()))
     if isinstance(ord_spec, tuple):
@@ -135,17 +180,33 @@ def _paginate(args, default_size: int, max_size: int):
 
 @job_bp.get("/jobs")
 def list_jobs():
-    from config import Config
-    with session_scope() as s:
-        base = select(Job)
+    include = {v.strip().lower() for v in request.args.get("include", "").split(",")}
+    with_description = "description" in include
+    with session_scope(read_only=True) as s:
+        if with_description:
+            base = select(Job).options(selectinload(Job.description_row))
+        else:
+            # Stored list_json fragments: no ORM objects, no tag loading
+            base = select(Job.id, Job.list_json)
         base = _apply_filters_sort(base, request.args)
         count_subq = base.order_by(None).subquery()
         total = s.execute(select(func.count()).select_from(count_subq)).scalar_one()
         page, page_size = _paginate(request.args, Config.PAGINATION_DEFAULT_PAGE_SIZE, Config.PAGINATION_MAX_PAGE_SIZE)
-        rows = s.execute(base.offset((page - 1) * page_size).limit(page_size)).unique().scalars().all()
+        page_q = base.offset((page - 1) * page_size).limit(page_size)
+        if with_description:
+            rows = s.execute(page_q).unique().scalars().all()
+            items = current_app.json.dumps([j.to_dict() for j in rows])
+        else:
+            rows = s.execute(page_q).all()
+            # Rows written before list_json existed (until `manage.py refresh-list-rows`)
+            missing = [r.id for r in rows if r.list_json is None]
+            built = {
+                j.id: encode_list_row(j.to_dict(include_description=False))
+                for j in s.execute(select(Job).where(Job.id.in_(missing))).scalars()
+            } if missing else {}
+            items = "[" + ",".join(r.list_json or built[r.id] for r in rows) + "]"
         pages = (total + page_size - 1) // page_size
-        return jsonify({
-            "items": [j.to_dict() for j in rows],
+        meta = current_app.json.dumps({
             "page": page,
             "page_size": page_size,
             "total": total,
@@ -157,11 +218,46 @@ def list_jobs():
                 "next_page": page + 1 if page < pages else None,
             },
         })
+        return current_app.response_class('{"items":' + items + "," + meta[1:], mimetype="application/json")
+
+@job_bp.get("/locations/suggest")
+def suggest_locations():
+    """Typeahead over distinct job locations.
+
+    Prefix matches rank first, then (Postgres) trigram similarity, so "lond"
+    and "new yrok" both find their city; then how many jobs use the location.
+    """
+    prefix = (request.args.get("prefix") or "").strip()
+    limit = max(1, min(request.args.get("limit", default=10, type=int) or 10, 50))
+    if len(prefix) < 2:
+        return jsonify({"prefix": prefix, "items": []})
+
+    with session_scope(read_only=True) as s:
+        postgres = s.get_bind().dialect.name == "postgresql"
+        matches = _contains(Job.location, prefix)
+        if postgres and len(prefix) >= 3:
+            matches = matches | Job.location.op("%")(prefix)  # pg_trgm similarity threshold
+        starts = Job.location.ilike(f"{_like_escape(prefix)}%", escape="\\")
+        n = func.count(Job.id).label("n")
+        rank = [case((starts, 1), else_=0).desc()]
+        if postgres:
+            rank.append(func.similarity(Job.location, prefix).desc())
+        rows = s.execute(
+            select(Job.location, n)
+            .where(matches)
+            .group_by(Job.location)
+            .order_by(*rank, n.desc(), Job.location)
+            .limit(limit)
+        ).all()
+    return jsonify({
+        "prefix": prefix,
+        "items": [{"location": loc, "jobs": count} for loc, count in rows],
+    })
 
 @job_bp.get("/jobs/<int:job_id>")
 def get_job(job_id: int):
-    with session_scope() as s:
-        job = s.get(Job, job_id)
+    with session_scope(read_only=True) as s:
+        job = s.get(Job, job_id, options=[selectinload(Job.description_row)])
         if not job:
             return jsonify({"error": "Job not found"}), 404
         return jsonify(job.to_dict())
@@ -188,15 +284,18 @@ def create_job():
         pa = _parse_posted_at(payload.get("posted_at"))
         if pa:
             job.posted_at = pa
-        tags = payload.get("tags") or []
-        if isinstance(tags, str):
-            tags = [t.strip() for t in tags.split(",") if t.strip()]
-        job.tags = _ensure_tags(s, tags)
+        job.tags = _ensure_tags(s, _payload_tags(payload))
+        job.refresh_content_hash()
+        sig = near_dup.signature_for(job.title, job.company, job.description)
+        near = _near_dup_of(s, sig) if Config.NEAR_DUP_POLICY != "off" else None
+        if near:
+            job.duplicate_of = near_dup.canonical_id(s, near["id"])
         s.add(job)
         try:
             s.flush()
         except IntegrityError:
             return jsonify({"error": "Duplicate source_url"}), 409
+        near_dup.index_job(s, job.id, sig)
         return jsonify(job.to_dict()), 201
 
 @job_bp.put("/jobs/<int:job_id>")
@@ -220,14 +319,13 @@ def update_job(job_id: int):
         if "posted_at" in payload:
             job.posted_at = _parse_posted_at(payload.get("posted_at"))
         if "tags" in payload:
-            tags = payload.get("tags") or []
-            if isinstance(tags, str):
-                tags = [t.strip() for t in tags.split(",") if t.strip()]
-            job.tags = _ensure_tags(s, tags)
+            job.tags = _ensure_tags(s, _payload_tags(payload))
+        job.refresh_content_hash()
         try:
             s.flush()
         except IntegrityError:
             return jsonify({"error": "Duplicate source_url"}), 409
+        near_dup.index_job(s, job.id, near_dup.signature_for(job.title, job.company, job.description))
         return jsonify(job.to_dict())
 
 @job_bp.delete("/jobs/<int:job_id>")
@@ -236,21 +334,86 @@ def delete_job(job_id: int):
         job = s.get(Job, job_id)
         if not job:
             return jsonify({"error": "Job not found"}), 404
+        near_dup.forget(s, job_id)
+        unlinked = s.execute(
+            update(Job).where(Job.duplicate_of == job_id).values(duplicate_of=None).returning(Job.id)
+        ).scalars().all()
+        mark_list_rows_stale(s, unlinked)
         s.delete(job)
         return "", 204
 
+@job_bp.get("/jobs/duplicates")
+def list_duplicate_clusters():
+    limit = max(1, min(request.args.get("limit", default=100, type=int) or 100, 1000))
+    with session_scope(read_only=True) as s:
+        roots = s.execute(
+            select(Job.duplicate_of, func.count())
+            .where(Job.duplicate_of.is_not(None))
+            .group_by(Job.duplicate_of)
+            .order_by(func.count().desc(), Job.duplicate_of)
+            .limit(limit)
+        ).all()
+        root_ids = [r[0] for r in roots]
+        cols = (Job.id, Job.title, Job.company, Job.location, Job.posting_date, Job.source_url, Job.duplicate_of)
+        rows = s.execute(
+            select(*cols).where(Job.id.in_(root_ids) | Job.duplicate_of.in_(root_ids)).order_by(Job.id)
+        ).all() if root_ids else []
+
+        def brief(r):
+            return {
+                "id": r.id, "title": r.title, "company": r.company, "location": r.location,
+                "posting_date": r.posting_date.isoformat() if r.posting_date else None,
+                "source_url": r.source_url,
+            }
+
+        clusters = {rid: {"canonical": None, "duplicates": []} for rid in root_ids}
+        for r in rows:
+            if r.id in clusters:
+                clusters[r.id]["canonical"] = brief(r)
+            if r.duplicate_of in clusters:
+                clusters[r.duplicate_of]["duplicates"].append(brief(r))
+        return jsonify({"clusters": [clusters[rid] for rid in root_ids], "total": len(root_ids)})
+
+def _fallback_match(s, payload: dict, pd):
+    row = s.execute(select(Job.id, Job.source_url, Job.content_hash).where(
+        func.lower(Job.title) == payload["title"].strip().lower(),
+        func.lower(Job.company) == payload["company"].strip().lower(),
+        func.lower(Job.location) == payload["location"].strip().lower(),
+        Job.posting_date == pd,
+    ).limit(1)).first()
+    return dict(row._mapping) if row else None
+
 @job_bp.post("/jobs/bulk")
 def bulk_insert_jobs():
     body = request.get_json(silent=True) or {}
     items = body.get("items") or []
     dry_run = bool(body.get("dry_run", False))
+    mode = str(body.get("mode") or "insert").strip().lower()
+    near_policy = str(body.get("near_duplicates") or Config.NEAR_DUP_POLICY).strip().lower()
+    listed_urls = body.get("listed_urls") or []
     if not isinstance(items, list) or not items:
         return jsonify({"error": "items must be a non-empty array"}), 400
+    if not isinstance(listed_urls, list):
+        return jsonify({"error": "listed_urls must be an array"}), 400
+    if mode not in ("insert", "upsert"):
+        return jsonify({"error": "mode must be 'insert' or 'upsert'"}), 400
+    if near_policy not in ("flag", "skip", "off"):
+        return jsonify({"error": "near_duplicates must be 'flag', 'skip' or 'off'"}), 400
 
     results = []
-    inserted = skipped = invalid = failed = 0
+    inserted = updated = unchanged = skipped = invalid = failed = 0
+    seen_ids: set[int] = set()  # existing jobs re-reported by the source
 
     with session_scope() as s:
+        # One query for every source_url in the batch: id + content hash only.
+        urls = {p.get("source_url") for p in items if isinstance(p, dict) and p.get("source_url")}
+        known: dict[str, dict] = {}
+        if urls:
+            rows = s.execute(
+                select(Job.id, Job.source_url, Job.content_hash).where(Job.source_url.in_(urls))
+            ).all()
+            known = {r.source_url: dict(r._mapping) for r in rows}
+
         for idx, payload in enumerate(items):
             v = _validate_job_payload(payload, is_update=False)
             if v:
@@ -265,26 +428,66 @@ def bulk_insert_jobs():
                 except Exception:
                     pass
             pa = _parse_posted_at(payload.get("posted_at"))
+            fp = _payload_fingerprint(payload)
 
-            candidate = None
-            if payload.get("source_url"):
-                candidate = s.execute(select(Job).where(Job.source_url == payload["source_url"])).unique().scalar_one_or_none()
+            candidate = known.get(payload.get("source_url") or "")
             if not candidate:
-                candidate = s.execute(select(Job).where(
-                    func.lower(Job.title) == payload["title"].strip().lower(),
-                    func.lower(Job.company) == payload["company"].strip().lower(),
-                    func.lower(Job.location) == payload["location"].strip().lower(),
-                    Job.posting_date == pd,
-                )).unique().scalar_one_or_none()
+                candidate = _fallback_match(s, payload, pd)
 
             if candidate:
+                seen_ids.add(candidate["id"])
+
+            if candidate and mode == "insert":
                 skipped += 1
-                results.append({"index": idx, "status": "skipped-duplicate", "existing_id": candidate.id, "existing_source_url": candidate.source_url})
+                results.append({"index": idx, "status": "skipped-duplicate", "existing_id": candidate["id"], "existing_source_url": candidate["source_url"]})
+                continue
+
+            if candidate:
+                if candidate["content_hash"] == fp:
+                    unchanged += 1
+                    results.append({"index": idx, "status": "unchanged", "id": candidate["id"]})
+                    continue
+                if dry_run:
+                    updated += 1
+                    results.append({"index": idx, "status": "would-update", "id": candidate["id"]})
+                    continue
+                job = s.get(Job, candidate["id"])
+                try:
+                    # Every write for this item, tag rows included, happens inside its
+                    # savepoint so a bad item cannot fail the rest of the batch
+                    with s.begin_nested():
+                        job.title = payload["title"].strip()
+                        job.company = payload["company"].strip()
+                        job.location = payload["location"].strip()
+                        job.description = payload.get("description") or None
+                        job.posting_date = pd
+                        job.posted_at = pa
+                        job.job_type = payload.get("job_type")
+                        job.salary_text = payload.get("salary_text")
+                        if payload.get("source_url"):
+                            job.source_url = payload["source_url"]
+                        job.tags = _ensure_tags(s, _payload_tags(payload))
+                        job.content_hash = fp
+                        s.flush()
+                        near_dup.index_job(s, job.id, near_dup.signature_for(job.title, job.company, job.description))
+                    candidate["content_hash"] = fp
+                    updated += 1
+                    results.append({"index": idx, "status": "updated", "id": job.id})
+                except (IntegrityError, DataError) as e:
+                    failed += 1
+                    results.append({"index": idx, "status": "error", "reason": _db_error_reason(e), "detail": str(e.orig)})
+                continue
+
+            sig = near_dup.signature_for(payload["title"], payload["company"], payload.get("description"))
+            near = _near_dup_of(s, sig) if near_policy != "off" else None
+            if near and near_policy == "skip":
+                skipped += 1
+                results.append({"index": idx, "status": "skipped-near-duplicate", "existing_id": near["id"], "similarity": near["similarity"]})
                 continue
 
             if dry_run:
                 inserted += 1
-                results.append({"index": idx, "status": "would-insert"})
+                results.append({"index": idx, "status": "would-insert", **({"near_duplicate_of": near} if near else {})})
                 continue
 
             job = Job(
@@ -297,21 +500,29 @@ def bulk_insert_jobs():
                 job_type=payload.get("job_type"),
                 salary_text=payload.get("salary_text"),
                 source_url=(payload.get("source_url") or None),
+                content_hash=fp,
+                duplicate_of=near_dup.canonical_id(s, near["id"]) if near else None,
             )
-            tags = payload.get("tags") or []
-            if isinstance(tags, str):
-                tags = [t.strip() for t in tags.split(",") if t.strip()]
-            job.tags = _ensure_tags(s, tags)
-
-            s.add(job)
             try:
-                s.flush()
+                with s.begin_nested():
+                    s.add(job)
+                    job.tags = _ensure_tags(s, _payload_tags(payload))
+                    s.flush()
+                    near_dup.index_job(s, job.id, sig)
+                if job.source_url:
+                    known[job.source_url] = {"id": job.id, "source_url": job.source_url, "content_hash": fp}
                 inserted += 1
-                results.append({"index": idx, "status": "inserted", "id": job.id})
-            except IntegrityError as e:
-                s.rollback()
+                results.append({"index": idx, "status": "inserted", "id": job.id, **({"near_duplicate_of": near} if near else {})})
+            except (IntegrityError, DataError) as e:
+                if job in s:
+                    s.expunge(job)
                 failed += 1
-                results.append({"index": idx, "status": "error", "reason": "constraint", "detail": str(e.orig)})
+                results.append({"index": idx, "status": "error", "reason": _db_error_reason(e), "detail": str(e.orig)})
+
+        if not dry_run:
+            retention.mark_seen(s, seen_ids)
+            retention.mark_listed(s, listed_urls)
 
-    summary = {"inserted": inserted, "skipped": skipped, "invalid": invalid, "failed": failed}
+    summary = {"inserted": inserted, "updated": updated, "unchanged": unchanged,
+               "skipped": skipped, "invalid": invalid, "failed": failed}
     return jsonify({"summary": summary, "results": results})
@@ -1,6 +1,8 @@
 import os, sys, threading, time
 from flask import Blueprint, jsonify, request
 
+from config import Config
+
 scrape_bp = Blueprint("scrape_bp", __name__)
 
 # Make the Scraper package importable
@@ -8,15 +10,36 @@ SCRAPER_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."
 if SCRAPER_DIR not in sys.path:
     sys.path.append(SCRAPER_DIR)
 
-try:
-    from scrape import run as scraper_run  # file is Scraper/scrape.py
-    _import_error = None
-except Exception as e:
-    scraper_run = None
-    _import_error = str(e)
+# Scraper (selenium, webdriver_manager, bs4, .env loading) is imported on first
+# use so API workers that never scrape don't pay for it at boot.
+_scraper = None
+_import_error = None
+_pool = None
+_load_lock = threading.Lock()
+
+
+def _load_scraper():
+    """Import Scraper/scrape.py once and build the shared driver pool."""
+    global _scraper, _import_error, _pool
+    with _load_lock:
+        if _scraper is None and _import_error is None:
+            try:
+                import scrape  # file is Scraper/scrape.py
+            except Exception as e:
+                _import_error = str(e)
+            else:
+                _scraper = scrape
+                # Headless drivers are kept warm between runs; headed runs get a throwaway driver.
+                _pool = scrape.DriverPool(
+                    size=Config.SCRAPER_POOL_SIZE,
+                    max_pages=Config.SCRAPER_POOL_MAX_PAGES,
+                    headless=True,
+                )
+    return _scraper
 
 _state = {
     "running": False,
+    "run_id": None,
     "fetched": 0,
     "limit": 0,
     "error": None,
@@ -26,22 +49,54 @@ _state = {
 _lock = threading.Lock()
 
 
+def warm_pool():
+    """Import the scraper and boot the pooled drivers in the background."""
+
+    def _warm():
+        if not _load_scraper():
+            print(f"Scraper import failed: {_import_error}")
+            return
+        try:
+            _pool.warm()
+        except Exception as e:
+            print(f"Scraper pool warm-up failed: {e}")
+
+    threading.Thread(target=_warm, daemon=True).start()
+
+
 def _on_progress(current: int, limit: int):
     with _lock:
         _state["fetched"] = int(current)
         _state["limit"] = int(limit or 0)
 
 
-def _runner(limit: int, headless: bool, api_base: str, base_url: str):
+def _on_start(run_id, limit: int):
+    with _lock:
+        _state["run_id"] = run_id
+        _state["limit"] = int(limit or 0)
+
+
+def _checkpoint():
+    from checkpoint import RunCheckpoint  # Scraper/checkpoint.py, stdlib only
+    return RunCheckpoint(Config.SCRAPE_CHECKPOINT_PATH)
+
+
+def _runner(limit: int, headless: bool, api_base: str, base_url: str, mode: str, run_id: int, resume: bool):
     global _state
     try:
-        scraper_run(
+        _scraper.run(
             limit=limit,
             headless=headless,
             save_mode="api",
             api_base=api_base,
             base_url=base_url,
             on_progress=_on_progress,
+            driver_pool=_pool if headless else None,
+            bulk_mode=mode,
+            checkpoint=_checkpoint(),
+            resume=run_id if resume else None,
+            run_id=None if resume else run_id,  # begun by start_scrape
+            on_start=_on_start,
         )
         with _lock:
             _state["running"] = False
@@ -55,7 +110,7 @@ def _runner(limit: int, headless: bool, api_base: str, base_url: str):
 
 @scrape_bp.post("/scrape/start")
 def start_scrape():
-    if _import_error or not scraper_run:
+    if not _load_scraper():
         return jsonify({"ok": False, "error": f"Scraper import failed: {_import_error or 'unknown'}"}), 500
 
     data = request.get_json(silent=True) or {}
@@ -63,12 +118,29 @@ def start_scrape():
     headless = bool(data.get("headless", True))
     api_base = data.get("api_base") or request.url_root.rstrip("/") + "/api"
     base_url = data.get("base_url") or "https://www.actuarylist.com/experience-levels/senior-actuary"
+    mode = "upsert" if str(data.get("mode") or "").strip().lower() == "upsert" else "insert"
+
+    resume = data.get("resume")
+    if resume is not None:
+        try:
+            resume = int(resume)
+        except (TypeError, ValueError):
+            return jsonify({"ok": False, "error": "resume must be a run id"}), 400
+        saved = _checkpoint().get(resume)
+        if saved is None:
+            return jsonify({"ok": False, "error": "Scrape run not found"}), 404
+        if saved["status"] == "done":
+            return jsonify({"ok": False, "error": "already-finished", "run": saved}), 409
+        limit = saved["limit"]
 
     with _lock:
         if _state["running"]:
             return jsonify({"ok": False, "error": "already-running", "status": _state}), 409
+        # Record new runs up front so the response carries the id to resume with
+        run_id = resume if resume is not None else _checkpoint().begin(base_url, limit, mode)
         _state.update({
             "running": True,
+            "run_id": run_id,
             "fetched": 0,
             "limit": limit,
             "error": None,
@@ -76,12 +148,27 @@ def start_scrape():
             "finished_at": None,
         })
 
-    t = threading.Thread(target=_runner, args=(limit, headless, api_base, base_url), daemon=True)
+    t = threading.Thread(target=_runner, args=(limit, headless, api_base, base_url, mode, run_id, resume is not None),
+                         daemon=True)
     t.start()
     return jsonify({"ok": True, "status": _state})
 
 
+@scrape_bp.get("/scrape/runs/<int:run_id>")
+def scrape_run(run_id: int):
+    saved = _checkpoint().get(run_id)
+    if saved is None:
+        return jsonify({"ok": False, "error": "Scrape run not found"}), 404
+    return jsonify({"ok": True, "run": saved})
+
+
 @scrape_bp.get("/scrape/status")
 def scrape_status():
     with _lock:
-        return jsonify({"ok": True, "status": _state})
+        return jsonify({"ok": True, "status": _state, "pool": _pool.stats() if _pool else None})
+
+
+@scrape_bp.get("/scrape/schedule")
+def schedule_status():
+    from scheduler import crawl_status
+    return jsonify({"ok": True, **crawl_status()})
@@ -0,0 +1,207 @@
+# APP/backend/salary.py
+"""Parse free-form salary text into currency, range, period and annual values.
+
+"$100K - $150K", "£45,000–£55,000 per annum", "€60-80k", "USD 50/hr" ...
+Annual values are in the posting's own currency (no FX conversion), so
+salary filters are only meaningful within one currency. Text without a
+currency, a pay period or a word like "salary" is not read as pay, and
+"401k" plans, bare years ("2024") and durations ("40 hours") are never
+amounts.
+
+    python manage.py backfill-salaries      # parse rows ingested before this existed
+"""
+import re, time
+
+# Bump when parsing changes: backfill() re-parses rows stored by an older version
+PARSER_VERSION = 2
+
+# Multiplier from each period to a year (40h weeks, 52 weeks, 260 working days)
+PERIOD_TO_YEAR = {"hour": 2080, "day": 260, "week": 52, "month": 12, "year": 1}
+
+_PERIODS = [
+    ("hour", r"(?:/|\bper|\ban?)\s*(?:hour|hr|h)\b|\bhourly\b|\bp/h\b"),
+    ("day", r"(?:/|\bper|\ba)\s*(?:day|d)\b|\bdaily\b|\bday\s*rate\b|\bp/d\b"),
+    ("week", r"(?:/|\bper|\ba)\s*(?:week|wk)\b|\bweekly\b|\bp/w\b"),
+    ("month", r"(?:/|\bper|\ba)\s*(?:month|mo|mth)\b|\bmonthly\b|\bp/m\b|\bpcm\b"),
+    ("year", r"(?:/|\bper|\ba)\s*(?:year|yr|annum)\b|\bannual(?:ly)?\b|\byearly\b|\bp[./]?a\b"),
+]
+_PERIOD_RES = [(name, re.compile(rx, re.I)) for name, rx in _PERIODS]
+
+# Longest symbols first so "CA$" wins over "$"
+_SYMBOLS = [
+    ("CA$", "CAD"), ("C$", "CAD"), ("AU$", "AUD"), ("A$", "AUD"), ("NZ$", "NZD"),
+    ("HK$", "HKD"), ("S$", "SGD"), ("US$", "USD"), ("R$", "BRL"),
+    ("$", "USD"), ("£", "GBP"), ("€", "EUR"), ("₹", "INR"), ("¥", "JPY"), ("₩", "KRW"),
+]
+_CODES = {
+    "USD", "GBP", "EUR", "CAD", "AUD", "NZD", "CHF", "SGD", "HKD", "INR", "JPY",
+    "ZAR", "SEK", "NOK", "DKK", "PLN", "BRL", "MXN", "CNY", "KRW", "AED",
+}
+_CODE_RE = re.compile(r"\b(" + "|".join(sorted(_CODES)) + r")\b", re.I)
+
+_NUM_RE = re.compile(
+    r"(?<![\w.])(\d{1,3}(?:[,.\s]\d{3})+|\d+(?:\.\d+)?)\s*([km])?(?![\w%])",
+    re.I,
+)
+_SUFFIX = {"k": 1_000, "m": 1_000_000}
+
+# US retirement plans, not pay: "401k", "401(k)", "403b"
+_PLAN_RE = re.compile(r"\b40[13]\s*\(?[kb]\)?(?!\w)", re.I)
+_YEAR_RE = re.compile(r"(?:19|20)\d\d")
+# Durations, not pay: "40 hours a week", "5+ years"
+_DURATION_RE = re.compile(r"\+?\s*(?:hours?|hrs|days|weeks|months|years|yrs)\b", re.I)
+_CONTEXT_RE = re.compile(
+    r"\b(?:salary|salaries|pay|paid|compensation|remuneration|wages?|ote|base|rate)\b", re.I
+)
+
+COLUMNS = (
+    "salary_currency", "salary_min", "salary_max", "salary_period",
+    "salary_annual_min", "salary_annual_max", "salary_parse_version",
+)
+
+
+def _number(digits: str) -> float:
+    if re.fullmatch(r"\d{1,3}(?:[,.\s]\d{3})+", digits):
+        return float(re.sub(r"[,.\s]", "", digits))
+    return float(digits)
+
+
+def _currency(text: str) -> str | None:
+    m = _CODE_RE.search(text)
+    if m:
+        return m.group(1).upper()
+    for symbol, code in _SYMBOLS:
+        if symbol in text:
+            return code
+    return None
+
+
+def _explicit_period(text: str) -> str | None:
+    for name, rx in _PERIOD_RES:
+        if rx.search(text):
+            return name
+    return None
+
+
+def _period(text: str, high: float) -> str | None:
+    explicit = _explicit_period(text)
+    if explicit:
+        return explicit
+    # No unit given: big numbers are annual, small ones hourly, the rest unknown
+    if high >= 10_000:
+        return "year"
+    if high <= 200:
+        return "hour"
+    return None
+
+
+def _is_year(s: str, m: re.Match) -> bool:
+    # "2024" on its own; "$2024" or "2024 EUR" is an amount
+    if m.group(2) or not _YEAR_RE.fullmatch(m.group(1)):
+        return False
+    before, after = s[:m.start()].rstrip(), s[m.end():].lstrip()
+    if any(before.endswith(symbol) for symbol, _ in _SYMBOLS):
+        return False
+    return not (_CODE_RE.search(before[-3:]) or _CODE_RE.match(after[:3]))
+
+
+def parse(text: str | None) -> dict | None:
+    """Return {currency, min, max, period, annual_min, annual_max} or None."""
+    if not text:
+        return None
+    s = str(text).replace("–", "-").replace("—", "-").replace("\xa0", " ")
+    s = _PLAN_RE.sub(" ", s)
+    currency = _currency(s)
+    if not (currency or _explicit_period(s) or _CONTEXT_RE.search(s)):
+        return None
+    nums = []
+    for m in _NUM_RE.finditer(s):
+        if _is_year(s, m) or _DURATION_RE.match(s, m.end()):
+            continue
+        suffix = (m.group(2) or "").lower()
+        nums.append((_number(m.group(1)), suffix))
+        if len(nums) == 2:
+            break
+    if not nums:
+        return None
+
+    # "60-80k": the trailing suffix applies to a bare leading number
+    if len(nums) == 2 and not nums[0][1] and nums[1][1] and nums[0][0] <= nums[1][0]:
+        nums[0] = (nums[0][0], nums[1][1])
+    values = [v * _SUFFIX.get(suffix, 1) for v, suffix in nums]
+    low, high = min(values), max(values)
+    if high <= 0:
+        return None
+
+    period = _period(s, high)
+    factor = PERIOD_TO_YEAR.get(period)
+    return {
+        "currency": currency,
+        "min": low,
+        "max": high,
+        "period": period,
+        "annual_min": int(round(low * factor)) if factor else None,
+        "annual_max": int(round(high * factor)) if factor else None,
+    }
+
+
+def columns(text: str | None) -> dict:
+    """Job column values for ``text``; all None when it does not parse."""
+    parsed = parse(text) or {}
+    return {
+        "salary_currency": parsed.get("currency"),
+        "salary_min": parsed.get("min"),
+        "salary_max": parsed.get("max"),
+        "salary_period": parsed.get("period"),
+        "salary_annual_min": parsed.get("annual_min"),
+        "salary_annual_max": parsed.get("annual_max"),
+        # Recorded even when nothing parses, so backfill() does not retry the row
+        "salary_parse_version": PARSER_VERSION if text else None,
+    }
+
+
+def backfill(session_factory, batch_size: int = 500, recompute: bool = False, pause: float = 0.0) -> dict:
+    """Parse salary_text for existing jobs in id-ordered batches.
+
+    Only rows never parsed by this PARSER_VERSION are visited unless ``recompute``.
+    """
+    from sqlalchemy import select, update, bindparam, or_
+    from models.job import Job, refresh_list_rows
+
+    table = Job.__table__
+    stmt = (
+        update(table)
+        .where(table.c.id == bindparam("b_id"))
+        # Pin updated_at: re-deriving columns is not a content edit
+        .values(updated_at=table.c.updated_at, **{c: bindparam(f"b_{c}") for c in COLUMNS})
+    )
+    scanned = parsed = batches = 0
+    last_id = 0
+    while True:
+        with session_factory() as s:
+            q = (
+                select(Job.id, Job.salary_text)
+                .where(Job.id > last_id, Job.salary_text.is_not(None))
+                .order_by(Job.id)
+                .limit(batch_size)
+            )
+            if not recompute:
+                q = q.where(or_(Job.salary_parse_version.is_(None), Job.salary_parse_version < PARSER_VERSION))
+            rows = s.execute(q).all()
+            if not rows:
+                break
+            params = []
+            for job_id, text in rows:
+                cols = columns(text)
+                if cols["salary_min"] is not None:
+                    parsed += 1
+                params.append({"b_id": job_id, **{f"b_{c}": v for c, v in cols.items()}})
+            s.connection().execute(stmt, params)
+            refresh_list_rows(s.connection(), [job_id for job_id, _ in rows])
+            s.commit()
+        scanned += len(rows)
+        batches += 1
+        last_id = rows[-1][0]
+        if pause:
+            time.sleep(pause)
+    return {"scanned": scanned, "parsed": parsed, "batches": batches}
@@ -0,0 +1,75 @@
+# APP/backend/scheduler.py
+"""Wires the scheduled crawler (Scraper/crawler.py) to Config and the database.
+
+Run it as its own process with ``python manage.py crawl``, or set
+CRAWL_SCHEDULER_ENABLED=true to start it inside the API. Either way a lock
+file next to CRAWL_STATE_PATH lets only one process run the crawler; other
+API workers (and a second ``manage.py crawl``) leave it alone.
+"""
+import os, sys, threading
+
+from config import Config
+
+SCRAPER_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "Scraper"))
+if SCRAPER_DIR not in sys.path:
+    sys.path.append(SCRAPER_DIR)
+
+_scheduler = None
+_lock = threading.Lock()
+_crawl_lock = None  # open lock file while this process owns the crawler
+
+
+class CrawlerLocked(RuntimeError):
+    pass
+
+
+def build_scheduler():
+    """Build the crawler; raises CrawlerLocked if another process runs it."""
+    global _crawl_lock
+    from frontier import lock_crawler  # stdlib only
+
+    if _crawl_lock is None:
+        _crawl_lock = lock_crawler(Config.CRAWL_STATE_PATH)
+        if _crawl_lock is None:
+            raise CrawlerLocked(f"another process is running the crawler for {Config.CRAWL_STATE_PATH}")
+
+    from crawler import CrawlScheduler, parse_listings  # imports selenium
+    from frontier import Frontier
+    import bulk_load
+
+    listings = parse_listings(Config.CRAWL_LISTINGS, Config.CRAWL_INTERVAL_MINUTES, Config.CRAWL_LISTING_LIMIT)
+    return CrawlScheduler(
+        listings=listings,
+        frontier=Frontier(Config.CRAWL_STATE_PATH),
+        save=lambda items: bulk_load.save_jobs(items, mode=Config.CRAWL_SAVE_MODE),
+        workers=Config.CRAWL_WORKERS,
+        tick_s=Config.CRAWL_TICK_SECONDS,
+        max_pages_per_driver=Config.SCRAPER_POOL_MAX_PAGES,
+    )
+
+
+def start_scheduler():
+    """Start the crawl loop in a background thread (idempotent)."""
+
+    def _start():
+        global _scheduler
+        with _lock:
+            if _scheduler is None:
+                try:
+                    _scheduler = build_scheduler()
+                except CrawlerLocked as e:
+                    print(f"Crawl scheduler not started here: {e}")
+                    return
+                except Exception as e:
+                    print(f"Crawl scheduler failed to start: {e}")
+                    return
+            _scheduler.start()
+
+    threading.Thread(target=_start, daemon=True).start()
+
+
+def crawl_status() -> dict:
+    from frontier import read_status  # stdlib only; never creates the state file
+    status = read_status(Config.CRAWL_STATE_PATH)
+    status["running_here"] = _scheduler is not None
+    return status
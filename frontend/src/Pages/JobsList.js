@@ -307,10 +307,10 @@ export default function JobsList() {
               {Array.isArray(j.tags) && j.tags.length ? (
                 <div className="tags">{j.tags.map((t) => <span key={t} className="tag">{t}</span>)}</div>
               ) : null}
-              {j.description ? (
+              {j.summary ? (
                 <div className="sub" style={{ marginTop: 8 }}>
-                  {j.description.slice(0, 160)}
-                  {j.description.length > 160 ? "…" : ""}
+                  {j.summary.slice(0, 160)}
+                  {j.summary.length > 160 ? "…" : ""}
                 </div>
               ) : null}
               <div className="actions">